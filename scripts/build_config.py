@@ -0,0 +1,75 @@
+"""
+Build the prebuilt default configuration module.
+
+Loads config/mission_default.yaml and config/waypoints_mvp.yaml and writes
+src/_config_prebuilt.py containing the equivalent MissionConfig as literal
+dataclass construction calls, so the default mission starts without parsing
+any YAML.
+
+Usage:
+    python scripts/build_config.py
+
+Re-run after editing the default YAML files or src/config.py. The prebuilt
+module is ignored automatically while it is older than either YAML file or
+was built from a different version of src/config.py.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import PROJECT_ROOT
+from src.config import (
+    ConfigManager,
+    DEFAULT_MISSION_PATH,
+    DEFAULT_WAYPOINTS_PATH,
+    PREBUILT_CONFIG_PATH,
+    config_schema_hash,
+)
+
+
+TEMPLATE = '''"""
+Prebuilt default configuration.
+
+Generated by scripts/build_config.py from {mission_path} and
+{waypoints_path}. Do not edit by hand.
+"""
+
+from .config import (
+    DetectionConfig,
+    FlightConfig,
+    LoggingConfig,
+    MissionConfig,
+    PhotoAngle,
+    PhotoConfig,
+    SafetyConfig,
+    Waypoint,
+    WaypointsConfig,
+)
+
+# Hash of src/config.py this module was built from
+SCHEMA_HASH = {schema_hash!r}
+
+DEFAULT_MISSION = {mission!r}
+'''
+
+
+def main() -> int:
+    config = ConfigManager(str(PROJECT_ROOT))
+    config.load_mission(DEFAULT_MISSION_PATH)
+    config.load_waypoints(DEFAULT_WAYPOINTS_PATH)
+    
+    PREBUILT_CONFIG_PATH.write_text(TEMPLATE.format(
+        mission_path=DEFAULT_MISSION_PATH,
+        waypoints_path=DEFAULT_WAYPOINTS_PATH,
+        schema_hash=config_schema_hash(),
+        mission=config.mission,
+    ))
+    print(f"Wrote {PREBUILT_CONFIG_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
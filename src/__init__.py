@@ -5,5 +5,10 @@ Automated drone photography system using DJI Tello to document work progress
 on steel structures in an indoor workshop.
 """
 
+from pathlib import Path
+
 __version__ = "0.1.0"
 __author__ = "Arne Reabel"
+
+# Project root (parent of src/), used to resolve relative config paths
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
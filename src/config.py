@@ -4,30 +4,68 @@ Configuration Management for Drone Photography System.
 Loads and validates configuration from YAML files.
 """
 
+import functools
+import json
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
+from dataclasses import dataclass, field, replace
 
 import yaml
 
+from . import PROJECT_ROOT
 
-@dataclass
+# Prefer the libyaml-backed C parser; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# orjson is optional; it decodes the sidecar cache several times faster
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads  # type: ignore[assignment]
+    
+    def _json_dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        return json.dumps(obj).encode('utf-8')
+
+# Default config locations, relative to the project root
+DEFAULT_MISSION_PATH = "config/mission_default.yaml"
+DEFAULT_WAYPOINTS_PATH = "config/waypoints_mvp.yaml"
+
+# Generated by scripts/build_config.py from the default config files
+PREBUILT_CONFIG_PATH = Path(__file__).parent / "_config_prebuilt.py"
+
+
+@dataclass(slots=True, frozen=True)
 class FlightConfig:
     """Flight-related configuration."""
     takeoff_height_cm: int = 100
     movement_speed: int = 50
     hover_stability_delay_sec: float = 2.0
+    optimize_order: bool = False  # Reorder waypoints nearest-first
+    fast_commands: bool = False  # Send moves on a lightweight UDP client
 
 
-@dataclass
-class PhotoAngle:
+class PhotoAngle(NamedTuple):
     """Single photo angle definition."""
     name: str
     rotation: int  # degrees, negative = left, positive = right
 
 
-@dataclass
+# Default angles: front, left 45°, right 45°
+_DEFAULT_ANGLES = (
+    PhotoAngle("front", 0),
+    PhotoAngle("left45", -45),
+    PhotoAngle("right45", 45),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class PhotoConfig:
     """Photography configuration."""
     angles: List[PhotoAngle] = field(default_factory=list)
@@ -36,22 +74,20 @@ class PhotoConfig:
     
     def __post_init__(self):
         if not self.angles:
-            # Default angles: front, left 45°, right 45°
-            self.angles = [
-                PhotoAngle("front", 0),
-                PhotoAngle("left45", -45),
-                PhotoAngle("right45", 45),
-            ]
+            # Frozen dataclass, so bypass __setattr__
+            object.__setattr__(self, 'angles', list(_DEFAULT_ANGLES))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DetectionConfig:
     """QR detection configuration."""
     qr_timeout_sec: float = 3.0
     fallback_id: str = "UNKNOWN"
+    use_pyzbar: bool = False  # Decode with zbar instead of OpenCV
+    scan_scale: float = 0.5  # Downscale factor applied before decoding
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SafetyConfig:
     """Safety module configuration."""
     obstacle_check_enabled: bool = True
@@ -59,9 +95,10 @@ class SafetyConfig:
     gesture_confidence_threshold: float = 0.7
     emergency_gesture: str = "crossed_arms"
     gesture_check_interval_sec: float = 0.5
+    obstacle_scan_scale: float = 1.0  # Downscale factor for edge detection
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -69,8 +106,7 @@ class LoggingConfig:
     console: bool = True
 
 
-@dataclass
-class Waypoint:
+class Waypoint(NamedTuple):
     """Single waypoint definition."""
     name: str
     x: int  # cm, relative to takeoff
@@ -79,7 +115,17 @@ class Waypoint:
     description: str = ""
 
 
-@dataclass 
+# Field defaults applied to waypoints missing keys in the YAML
+_WAYPOINT_DEFAULTS: Dict[str, Any] = {
+    "name": "Unnamed",
+    "x": 0,
+    "y": 0,
+    "z": 100,
+    "description": "",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class WaypointsConfig:
     """Waypoints configuration."""
     waypoints: List[Waypoint] = field(default_factory=list)
@@ -87,7 +133,7 @@ class WaypointsConfig:
     navigation_speed: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MissionConfig:
     """Complete mission configuration."""
     flight: FlightConfig = field(default_factory=FlightConfig)
@@ -98,6 +144,70 @@ class MissionConfig:
     waypoints_config: WaypointsConfig = field(default_factory=WaypointsConfig)
 
 
+def _sidecar_path(full_path: Path) -> Path:
+    """Get the JSON sidecar cache path for a YAML config file."""
+    return full_path.with_suffix(full_path.suffix + '.jsoncache')
+
+
+def _read_yaml_file(full_path: Path) -> Dict[str, Any]:
+    """
+    Read a YAML config file, using a JSON sidecar cache when fresh.
+    
+    The cache records the YAML file's mtime (ns) and size and is reused
+    only while both still match exactly, so a replacement file carrying
+    an older timestamp (cp -p, rsync -t, restored backup) is re-parsed.
+    Cache write failures (e.g. read-only config directory) are ignored.
+    
+    Args:
+        full_path: Resolved path to the YAML file.
+        
+    Returns:
+        Parsed YAML content.
+    """
+    cache_path = _sidecar_path(full_path)
+    st = full_path.stat()
+    source = [st.st_mtime_ns, st.st_size]
+    
+    try:
+        cached = _json_loads(cache_path.read_bytes())
+        if cached.get("source") == source:
+            return cached["data"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    
+    # Binary mode lets libyaml decode the bytes itself
+    with open(full_path, 'rb') as f:
+        raw = yaml.load(f, Loader=_YamlLoader)
+    
+    try:
+        cache_path.write_bytes(_json_dumps({"source": source, "data": raw}))
+    except (OSError, TypeError, ValueError):
+        pass
+    
+    return raw
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """
+    Parse a YAML config file into a read-only tree.
+    
+    mtime_ns and size are part of the cache key only, matching the sidecar
+    check. The result is shared by every caller, so mappings are returned
+    as read-only proxies and lists as tuples.
+    """
+    return _freeze(_read_yaml_file(Path(path)))
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert parsed YAML into read-only containers."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 class ConfigManager:
     """
     Manages loading and accessing configuration.
@@ -120,14 +230,21 @@ class ConfigManager:
                        Defaults to project root.
         """
         if base_path is None:
-            # Default to project root (parent of src/)
-            self.base_path = Path(__file__).parent.parent
+            self.base_path = PROJECT_ROOT
         else:
             self.base_path = Path(base_path)
         
-        self.mission = MissionConfig()
-        self._raw_mission: Dict[str, Any] = {}
-        self._raw_waypoints: Dict[str, Any] = {}
+        # Built on first load (or first access) to skip a throwaway default tree
+        self._mission: Optional[MissionConfig] = None
+        self._raw_mission: Mapping[str, Any] = {}
+        self._raw_waypoints: Mapping[str, Any] = {}
+        
+        # Memoized _resolve_path results; base_path is fixed after init
+        self._resolved: Dict[str, Path] = {}
+        
+        # Resolved (and created) directories, reset on mission reload
+        self._output_dir: Optional[Path] = None
+        self._log_path: Optional[Path] = None
     
     def load_mission(self, config_path: str) -> MissionConfig:
         """
@@ -140,11 +257,11 @@ class ConfigManager:
             Loaded MissionConfig object.
         """
         full_path = self._resolve_path(config_path)
-        
-        with open(full_path, 'r') as f:
-            self._raw_mission = yaml.safe_load(f)
+        self._raw_mission = self._read_yaml(full_path)
         
         self._parse_mission_config()
+        self._output_dir = None
+        self._log_path = None
         return self.mission
     
     def load_waypoints(self, config_path: str) -> List[Waypoint]:
@@ -158,13 +275,22 @@ class ConfigManager:
             List of Waypoint objects.
         """
         full_path = self._resolve_path(config_path)
-        
-        with open(full_path, 'r') as f:
-            self._raw_waypoints = yaml.safe_load(f)
+        self._raw_waypoints = self._read_yaml(full_path)
         
         self._parse_waypoints_config()
         return self.waypoints
     
+    @property
+    def mission(self) -> MissionConfig:
+        """Get mission configuration (defaults if nothing loaded yet)."""
+        if self._mission is None:
+            self._mission = MissionConfig()
+        return self._mission
+    
+    @mission.setter
+    def mission(self, mission: MissionConfig) -> None:
+        self._mission = mission
+    
     @property
     def waypoints(self) -> List[Waypoint]:
         """Get list of waypoints."""
@@ -177,39 +303,53 @@ class ConfigManager:
     
     def _resolve_path(self, path: str) -> Path:
         """Resolve path relative to base path if not absolute."""
-        p = Path(path)
-        if p.is_absolute():
-            return p
-        return self.base_path / p
+        resolved = self._resolved.get(path)
+        if resolved is None:
+            p = Path(path)
+            resolved = p if p.is_absolute() else self.base_path / p
+            self._resolved[path] = resolved
+        return resolved
+    
+    def _read_yaml(self, full_path: Path) -> Mapping[str, Any]:
+        """
+        Read a YAML config file, memoized per process on (path, mtime, size).
+        
+        Args:
+            full_path: Resolved path to the YAML file.
+            
+        Returns:
+            Parsed YAML content, read-only since it is shared between callers.
+        """
+        st = full_path.stat()
+        return _parse_yaml_cached(str(full_path), st.st_mtime_ns, st.st_size)
     
     def _parse_mission_config(self) -> None:
         """Parse raw mission dict into dataclasses."""
         raw = self._raw_mission
         
-        # Flight config
-        if 'flight' in raw:
-            self.mission.flight = FlightConfig(**raw['flight'])
-        
-        # Photo config
-        if 'photo' in raw:
-            photo_raw = raw['photo'].copy()
-            if 'angles' in photo_raw:
-                photo_raw['angles'] = [
-                    PhotoAngle(**a) for a in photo_raw['angles']
-                ]
-            self.mission.photo = PhotoConfig(**photo_raw)
-        
-        # Detection config
-        if 'detection' in raw:
-            self.mission.detection = DetectionConfig(**raw['detection'])
-        
-        # Safety config
-        if 'safety' in raw:
-            self.mission.safety = SafetyConfig(**raw['safety'])
+        # Keep waypoints if they were loaded first
+        if self._mission is not None:
+            waypoints_config = self._mission.waypoints_config
+        else:
+            waypoints_config = WaypointsConfig()
         
-        # Logging config
-        if 'logging' in raw:
-            self.mission.logging = LoggingConfig(**raw['logging'])
+        # Config tree is frozen, so build it in one shot
+        self._mission = MissionConfig(
+            flight=FlightConfig(**raw.get('flight', {})),
+            photo=self._build_photo_config(raw.get('photo', {})),
+            detection=DetectionConfig(**raw.get('detection', {})),
+            safety=SafetyConfig(**raw.get('safety', {})),
+            logging=LoggingConfig(**raw.get('logging', {})),
+            waypoints_config=waypoints_config,
+        )
+    
+    @staticmethod
+    def _build_photo_config(photo_raw: Mapping[str, Any]) -> PhotoConfig:
+        """Build PhotoConfig from its raw dict; unknown keys raise TypeError."""
+        return PhotoConfig(**{
+            **photo_raw,
+            'angles': [PhotoAngle(**a) for a in photo_raw.get('angles', [])],
+        })
     
     def _parse_waypoints_config(self) -> None:
         """Parse raw waypoints dict into dataclasses."""
@@ -217,37 +357,103 @@ class ConfigManager:
         
         waypoints = []
         for wp_raw in raw.get('waypoints', []):
-            waypoints.append(Waypoint(
-                name=wp_raw.get('name', 'Unnamed'),
-                x=wp_raw.get('x', 0),
-                y=wp_raw.get('y', 0),
-                z=wp_raw.get('z', 100),
-                description=wp_raw.get('description', ''),
-            ))
+            fields = _WAYPOINT_DEFAULTS | wp_raw
+            if len(fields) != len(_WAYPOINT_DEFAULTS):
+                # Ignore unknown keys
+                fields = {k: fields[k] for k in _WAYPOINT_DEFAULTS}
+            waypoints.append(Waypoint(**fields))
         
-        self.mission.waypoints_config = WaypointsConfig(
+        waypoints_config = WaypointsConfig(
             waypoints=waypoints,
             return_home=raw.get('return_home', True),
             navigation_speed=raw.get('navigation_speed'),
         )
+        
+        if self._mission is None:
+            self._mission = MissionConfig(waypoints_config=waypoints_config)
+        else:
+            self._mission = replace(self._mission, waypoints_config=waypoints_config)
     
     def get_output_directory(self) -> Path:
         """Get resolved photo output directory path."""
-        output_dir = self._resolve_path(self.mission.photo.output_directory)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        return output_dir
+        if self._output_dir is None:
+            output_dir = self._resolve_path(self.mission.photo.output_directory)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dir = output_dir
+        return self._output_dir
     
     def get_log_file_path(self) -> Path:
         """Get resolved log file path."""
-        log_path = self._resolve_path(self.mission.logging.file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        return log_path
+        if self._log_path is None:
+            log_path = self._resolve_path(self.mission.logging.file)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._log_path = log_path
+        return self._log_path
+
+
+def config_schema_hash() -> str:
+    """
+    Get a hash of this module's source.
+    
+    The prebuilt config is a repr() of the dataclasses defined here, so any
+    edit to this file may invalidate it.
+    
+    Returns:
+        Hex digest identifying the current config schema.
+    """
+    import hashlib
+    
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _load_prebuilt_mission(
+    config: ConfigManager,
+    mission_path: str,
+    waypoints_path: str,
+) -> Optional[MissionConfig]:
+    """
+    Get the prebuilt default mission if it applies and is up to date.
+    
+    Args:
+        config: ConfigManager used to resolve the config paths.
+        mission_path: Requested mission config path.
+        waypoints_path: Requested waypoints config path.
+        
+    Returns:
+        Prebuilt MissionConfig, or None if the YAML files must be loaded.
+    """
+    defaults = (
+        PROJECT_ROOT / DEFAULT_MISSION_PATH,
+        PROJECT_ROOT / DEFAULT_WAYPOINTS_PATH,
+    )
+    requested = (
+        config._resolve_path(mission_path),
+        config._resolve_path(waypoints_path),
+    )
+    
+    try:
+        if [p.resolve() for p in requested] != [p.resolve() for p in defaults]:
+            return None
+        
+        prebuilt_mtime = PREBUILT_CONFIG_PATH.stat().st_mtime
+        if any(p.stat().st_mtime > prebuilt_mtime for p in defaults):
+            return None
+        
+        from ._config_prebuilt import DEFAULT_MISSION, SCHEMA_HASH  # type: ignore
+        
+        # Built against a different version of the config dataclasses
+        if SCHEMA_HASH != config_schema_hash():
+            return None
+    except (OSError, ImportError):
+        return None
+    
+    return DEFAULT_MISSION
 
 
 # Convenience function for quick loading
 def load_config(
-    mission_path: str = "config/mission_default.yaml",
-    waypoints_path: str = "config/waypoints_mvp.yaml",
+    mission_path: str = DEFAULT_MISSION_PATH,
+    waypoints_path: str = DEFAULT_WAYPOINTS_PATH,
     base_path: Optional[str] = None,
 ) -> ConfigManager:
     """
@@ -262,6 +468,12 @@ def load_config(
         Configured ConfigManager instance.
     """
     config = ConfigManager(base_path)
+    
+    prebuilt = _load_prebuilt_mission(config, mission_path, waypoints_path)
+    if prebuilt is not None:
+        config.mission = prebuilt
+        return config
+    
     config.load_mission(mission_path)
     config.load_waypoints(waypoints_path)
     return config
@@ -4,18 +4,17 @@ Main Entry Point for Drone Photography System.
 Run a photography mission or test individual components.
 """
 
-import argparse
 import sys
 import os
 from pathlib import Path
+from typing import NoReturn
 
 # Add project root to path for imports
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from src import PROJECT_ROOT
 from src.config import load_config, ConfigManager
 from src.utils.logger import setup_logger, get_logger
-from src.state_machine import MissionStateMachine, MissionState
 
 
 def run_mission(
@@ -34,6 +33,9 @@ def run_mission(
     Returns:
         Exit code (0 = success, 1 = error).
     """
+    # Imported here so --test modes don't pull in cv2/mediapipe
+    from src.state_machine import MissionStateMachine, MissionState
+    
     # Load configuration
     config = load_config(
         mission_path=mission_config,
@@ -49,13 +51,16 @@ def run_mission(
     )
     
     logger = get_logger()
-    logger.info("=" * 60)
-    logger.info("DRONE PHOTOGRAPHY SYSTEM")
-    logger.info("=" * 60)
-    logger.info(f"Mode: {'SIMULATION' if simulate else 'LIVE'}")
-    logger.info(f"Waypoints: {len(config.waypoints)}")
-    logger.info(f"Photo angles: {len(config.mission.photo.angles)}")
-    logger.info("=" * 60)
+    banner = "\n".join([
+        "=" * 60,
+        "DRONE PHOTOGRAPHY SYSTEM",
+        "=" * 60,
+        f"Mode: {'SIMULATION' if simulate else 'LIVE'}",
+        f"Waypoints: {len(config.waypoints)}",
+        f"Photo angles: {len(config.mission.photo.angles)}",
+        "=" * 60,
+    ])
+    logger.info("%s", banner)
     
     # Connect to drone (if not simulating)
     tello = None
@@ -69,7 +74,7 @@ def run_mission(
             
             # Log battery level
             battery = tello.get_battery()
-            logger.info(f"Connected! Battery: {battery}%")
+            logger.info("Connected! Battery: %s%%", battery)
             
             if battery < 20:
                 logger.warning("Battery low! Consider charging before mission.")
@@ -83,7 +88,7 @@ def run_mission(
             logger.info("Switching to simulation mode...")
             simulate = True
         except Exception as e:
-            logger.error(f"Failed to connect to drone: {e}")
+            logger.error("Failed to connect to drone: %s", e)
             logger.info("Switching to simulation mode...")
             simulate = True
     
@@ -199,61 +204,128 @@ def test_safety() -> int:
         return 1
 
 
-def main():
-    """Main entry point with CLI."""
-    parser = argparse.ArgumentParser(
-        description="Drone Photography System for Steel Structure Documentation",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+USAGE = """\
+usage: main.py [-h] [--live] [--mission-config MISSION_CONFIG]
+               [--waypoints-config WAYPOINTS_CONFIG]
+               [--test {connection,qr,safety}]
+
+Drone Photography System for Steel Structure Documentation
+
+options:
+  -h, --help            show this help message and exit
+  --live                Run with real drone (default is simulation)
+  --mission-config MISSION_CONFIG
+                        Path to mission configuration file
+  --waypoints-config WAYPOINTS_CONFIG
+                        Path to waypoints configuration file
+  --test {connection,qr,safety}
+                        Run a specific test instead of mission
+
 Examples:
   python main.py                     # Run mission in simulation mode
   python main.py --live              # Run mission with real drone
   python main.py --test connection   # Test drone connection
   python main.py --test qr           # Test QR detection with webcam
   python main.py --test safety       # Test gesture detection with webcam
-        """,
-    )
+"""
+
+TEST_CHOICES = ("connection", "qr", "safety")
+
+
+def _usage_error(message: str) -> NoReturn:
+    """Print usage error and exit with argparse-compatible status."""
+    print(USAGE.split("\n\n")[0], file=sys.stderr)
+    print(f"main.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def _is_option(token: str) -> bool:
+    """Check whether a token is an option rather than a value, as argparse does."""
+    if not token.startswith("-") or token == "-":
+        return False
+    # Negative numbers are values; no option here looks like one
+    try:
+        float(token)
+    except ValueError:
+        return True
+    return False
+
+
+def parse_args(argv: list) -> dict:
+    """
+    Parse command line arguments.
     
-    parser.add_argument(
-        "--live",
-        action="store_true",
-        help="Run with real drone (default is simulation)",
-    )
+    Hand-rolled instead of argparse to keep CLI startup cheap.
     
-    parser.add_argument(
-        "--mission-config",
-        default="config/mission_default.yaml",
-        help="Path to mission configuration file",
-    )
+    Args:
+        argv: Arguments without the program name.
+        
+    Returns:
+        Dict with keys live, mission_config, waypoints_config and test.
+    """
+    args = {
+        "live": False,
+        "mission_config": "config/mission_default.yaml",
+        "waypoints_config": "config/waypoints_mvp.yaml",
+        "test": None,
+    }
+    value_options = {
+        "--mission-config": "mission_config",
+        "--waypoints-config": "waypoints_config",
+        "--test": "test",
+    }
     
-    parser.add_argument(
-        "--waypoints-config",
-        default="config/waypoints_mvp.yaml",
-        help="Path to waypoints configuration file",
-    )
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        option, has_inline_value, inline_value = arg.partition("=")
+        
+        if arg in ("-h", "--help"):
+            print(USAGE, end="")
+            sys.exit(0)
+        elif arg == "--live":
+            args["live"] = True
+        elif option in value_options:
+            if has_inline_value:
+                value = inline_value
+            elif i + 1 < len(argv) and not _is_option(argv[i + 1]):
+                i += 1
+                value = argv[i]
+            else:
+                _usage_error(f"argument {option}: expected one argument")
+            args[value_options[option]] = value
+        else:
+            _usage_error(f"unrecognized arguments: {arg}")
+        i += 1
     
-    parser.add_argument(
-        "--test",
-        choices=["connection", "qr", "safety"],
-        help="Run a specific test instead of mission",
-    )
+    if args["test"] is not None and args["test"] not in TEST_CHOICES:
+        choices = ", ".join(f"'{c}'" for c in TEST_CHOICES)
+        _usage_error(
+            f"argument --test: invalid choice: '{args['test']}' "
+            f"(choose from {choices})"
+        )
     
-    args = parser.parse_args()
+    return args
+
+
+def main():
+    """Main entry point with CLI."""
+    args = parse_args(sys.argv[1:])
     
     # Handle test modes
-    if args.test:
-        if args.test == "connection":
+    if args["test"]:
+        if args["test"] == "connection":
             return test_connection()
-        elif args.test == "qr":
+        elif args["test"] == "qr":
             return test_qr()
-        elif args.test == "safety":
+        elif args["test"] == "safety":
             return test_safety()
     
     # Run mission
     return run_mission(
-        mission_config=args.mission_config,
-        waypoints_config=args.waypoints_config,
-        simulate=not args.live,
+        mission_config=args["mission_config"],
+        waypoints_config=args["waypoints_config"],
+        simulate=not args["live"],
     )
 
 
@@ -8,9 +8,35 @@ Modules:
 - safety: Obstacle avoidance and emergency gesture detection
 """
 
-from .flight_navigator import FlightNavigator
-from .qr_detector import QRDetector
-from .photo_capture import PhotoCapture
-from .safety import SafetyModule
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .flight_navigator import FlightNavigator
+    from .qr_detector import QRDetector
+    from .photo_capture import PhotoCapture
+    from .safety import SafetyModule
 
 __all__ = ["FlightNavigator", "QRDetector", "PhotoCapture", "SafetyModule"]
+
+# Submodules pull in cv2/pyzbar/mediapipe, so load them on first access
+_LAZY_SUBMODULES = {
+    "FlightNavigator": "flight_navigator",
+    "QRDetector": "qr_detector",
+    "PhotoCapture": "photo_capture",
+    "SafetyModule": "safety",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{_LAZY_SUBMODULES[name]}", __name__)
+        value = getattr(module, name)
+        # Cache so later lookups bypass __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
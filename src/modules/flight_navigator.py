@@ -4,23 +4,524 @@ Flight Navigator Module for Drone Photography System.
 Handles waypoint-based navigation for the Tello drone.
 """
 
+import asyncio
+import functools
+import logging
+from collections import Counter
+import queue
+import selectors
+import socket
 import time
-from typing import List, Optional, Tuple, Callable
+from threading import Lock, Thread
+from typing import Dict, List, Optional, Tuple, Callable
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum, auto
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
 
 from ..utils.logger import get_logger, LoggerMixin
 from ..config import Waypoint, FlightConfig
 
 
-class NavigationState(Enum):
+# Tello per-command movement limits
+MAX_MOVE_CM = 500
+MIN_MOVE_CM = 20  # Tello minimum
+
+# Smoothing factor for the command latency moving average
+LATENCY_EMA_ALPHA = 0.2
+
+# Longest wait for residual velocity to die down between chunked moves
+MOTION_SETTLE_TIMEOUT_SEC = 0.5
+
+# Attempts per move command and base delay for exponential backoff
+COMMAND_ATTEMPTS = 3
+RETRY_BACKOFF_SEC = 0.05
+
+# Tello SDK command port and ACK timeout (moves ACK on completion)
+TELLO_COMMAND_PORT = 8889
+COMMAND_TIMEOUT_SEC = 7.0
+
+
+# Axis moves in execution order (Z first for safety):
+# (position index, command if positive, command if negative)
+_AXIS_COMMANDS = (
+    (2, "move_up", "move_down"),
+    (0, "move_forward", "move_back"),
+    (1, "move_right", "move_left"),
+)
+
+
+class TelloCommandError(RuntimeError):
+    """The drone answered a command with an error instead of "ok"."""
+
+
+@functools.lru_cache(maxsize=None)
+def _command_error_types() -> Tuple[type, ...]:
+    """
+    Get the exception types raised for failed Tello commands.
+    
+    Resolved on first use so importing this module doesn't load
+    djitellopy (and its video stack).
+    
+    Returns:
+        Exception types from djitellopy and the fast client.
+    """
+    try:
+        from djitellopy.tello import TelloException
+    except ImportError:
+        return (TelloCommandError, TimeoutError)
+    return (TelloException, TelloCommandError, TimeoutError)
+
+
+def _is_rejection(error: Exception) -> bool:
+    """
+    Check whether a command failed on an explicit error reply.
+    
+    Only then is it certain the drone did not act on the command. A timeout
+    may hide a move that ran but whose "ok" was lost.
+    
+    Args:
+        error: Exception from one of _command_error_types().
+        
+    Returns:
+        True if the drone refused the command.
+    """
+    if isinstance(error, TelloCommandError):
+        return True
+    if isinstance(error, TimeoutError):
+        return False
+    
+    # djitellopy's TelloException carries the latest response text; a
+    # timeout reads "Aborting command ... Did not receive a response"
+    message = str(error).lower()
+    return "did not receive" not in message and (
+        "error" in message or "unknown command" in message
+    )
+
+
+@njit(cache=True)
+def _split_distance(distance: int) -> np.ndarray:
+    """
+    Split a distance into Tello-sized chunks.
+    
+    A trailing chunk below the Tello minimum is dropped. Compiled with
+    numba when available.
+    
+    Args:
+        distance: Positive distance in cm.
+        
+    Returns:
+        Chunk distances in cm.
+    """
+    full_chunks = distance // MAX_MOVE_CM
+    remainder = distance % MAX_MOVE_CM
+    count = full_chunks + (1 if remainder >= MIN_MOVE_CM else 0)
+    
+    chunks = np.empty(count, dtype=np.int64)
+    chunks[:full_chunks] = MAX_MOVE_CM
+    if count > full_chunks:
+        chunks[full_chunks] = remainder
+    
+    return chunks
+
+
+@functools.lru_cache(maxsize=256)
+def _plan_moves(
+    src: Tuple[int, int, int],
+    dst: Tuple[int, int, int],
+    speed: int,
+    use_go: bool = True,
+) -> Tuple[Tuple[str, Tuple[int, ...]], ...]:
+    """
+    Plan the Tello commands to fly from src to dst.
+    
+    Pure function, so repeated legs (same mission flown again) are a
+    cache hit and a full mission can be planned before takeoff.
+    
+    Args:
+        src: Start position (x, y, z) in cm.
+        dst: Target position (x, y, z) in cm.
+        speed: Movement speed (cm/s).
+        use_go: Fly straight-line "go" segments instead of axis moves.
+        
+    Returns:
+        Tuple of (Tello method name, args) pairs.
+    """
+    dx, dy, dz = (d - s for s, d in zip(src, dst))
+    plan = []
+    
+    if use_go:
+        # Equal segments so no axis exceeds the per-command limit
+        segments = -(-max(abs(dx), abs(dy), abs(dz)) // MAX_MOVE_CM)
+        for i in range(segments):
+            # Spread the remainder so segments sum exactly to the vector
+            sx = dx * (i + 1) // segments - dx * i // segments
+            sy = dy * (i + 1) // segments - dy * i // segments
+            sz = dz * (i + 1) // segments - dz * i // segments
+            
+            if max(abs(sx), abs(sy), abs(sz)) < MIN_MOVE_CM:
+                continue
+            
+            # Tello "go" uses positive y = left
+            plan.append(("go_xyz_speed", (sx, -sy, sz, speed)))
+    else:
+        delta = (dx, dy, dz)
+        for axis, positive, negative in _AXIS_COMMANDS:
+            command = positive if delta[axis] > 0 else negative
+            plan.extend(
+                (command, (int(chunk),))
+                for chunk in _split_distance(abs(delta[axis]))
+            )
+    
+    return tuple(plan)
+
+
+def _nearest_neighbor_order(
+    xyz: np.ndarray,
+    start: Tuple[int, int, int] = (0, 0, 0),
+) -> List[int]:
+    """
+    Order points greedily by always visiting the nearest unvisited one.
+    
+    O(N^2), which is well under a millisecond for mission-sized lists.
+    
+    Args:
+        xyz: (N, 3) array of positions in cm.
+        start: Position the tour starts from.
+        
+    Returns:
+        Point indices in visiting order.
+    """
+    points = xyz.astype(np.float64)
+    current = np.asarray(start, dtype=np.float64)
+    remaining = np.ones(len(points), dtype=bool)
+    order = []
+    
+    for _ in range(len(points)):
+        distances = np.linalg.norm(points - current, axis=1)
+        distances[~remaining] = np.inf
+        nearest = int(np.argmin(distances))
+        order.append(nearest)
+        remaining[nearest] = False
+        current = points[nearest]
+    
+    return order
+
+
+class NavigationState(IntEnum):
     """Navigation state."""
-    IDLE = "idle"
-    NAVIGATING = "navigating"
-    AT_WAYPOINT = "at_waypoint"
-    RETURNING_HOME = "returning_home"
-    COMPLETE = "complete"
-    ERROR = "error"
+    IDLE = auto()
+    NAVIGATING = auto()
+    AT_WAYPOINT = auto()
+    RETURNING_HOME = auto()
+    COMPLETE = auto()
+    ERROR = auto()
+    
+    def __str__(self) -> str:
+        # Readable in logs instead of IntEnum's bare number
+        return self.name.lower()
+
+
+class _TelemetryCache:
+    """
+    Snapshot of the Tello state stream (UDP 8890, ~10 Hz).
+    
+    djitellopy already owns the 8890 socket and parses each packet into a
+    dict, so the cache copies from that dict instead of opening a second
+    socket (which would steal packets). Reads never cost a command
+    round-trip.
+    """
+    
+    __slots__ = ("_tello", "_lock", "height", "vgx", "vgy", "vgz", "bat")
+    
+    def __init__(self, tello=None):
+        self._tello = tello
+        self._lock = Lock()
+        self.height = 0  # cm
+        self.vgx = 0     # cm/s
+        self.vgy = 0
+        self.vgz = 0
+        self.bat = 0     # %
+    
+    def set_tello(self, tello) -> None:
+        """Set the Tello instance to read state from."""
+        self._tello = tello
+    
+    def refresh(self) -> bool:
+        """
+        Update fields from the latest state packet.
+        
+        Returns:
+            True if state was available.
+        """
+        if self._tello is None:
+            return False
+        
+        try:
+            state = self._tello.get_current_state()
+        except Exception:
+            return False
+        if not state:
+            return False
+        
+        with self._lock:
+            self.height = int(state.get("h", self.height))
+            self.vgx = int(state.get("vgx", self.vgx))
+            self.vgy = int(state.get("vgy", self.vgy))
+            self.vgz = int(state.get("vgz", self.vgz))
+            self.bat = int(state.get("bat", self.bat))
+        return True
+
+
+class _DroneLink:
+    """ACK queue and exchange lock shared by all clients of one drone."""
+    
+    __slots__ = ("acks", "lock", "clients")
+    
+    def __init__(self):
+        self.acks: "queue.Queue[bytes]" = queue.Queue()
+        # The Tello matches replies to commands only by order, so one
+        # command/ACK exchange per drone may be in flight at a time
+        self.lock = Lock()
+        self.clients = 0
+
+
+class TelloReceiver(LoggerMixin):
+    """
+    Process-wide UDP socket for Tello commands and ACKs.
+    
+    One socket and one selector thread serve every drone; ACKs are routed
+    to a per-drone queue by source IP. This keeps the syscall and file
+    descriptor cost constant as drones are added (e.g. a swarm), and lets
+    the navigator and anything else commanding the same drone share one
+    receive path.
+    
+    Usage:
+        receiver = TelloReceiver.instance()
+        link = receiver.register("192.168.10.1")
+        with link.lock:
+            receiver.send("192.168.10.1", b"command")
+            response = link.acks.get(timeout=7.0)
+        receiver.unregister("192.168.10.1")
+    """
+    
+    _instance: Optional["TelloReceiver"] = None
+    _instance_lock = Lock()
+    
+    def __init__(self):
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(("", 0))
+        self._sock.setblocking(False)
+        
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._sock, selectors.EVENT_READ)
+        
+        # Per-drone links, reference counted by registered clients
+        self._links: Dict[str, _DroneLink] = {}
+        self._links_lock = Lock()
+        self._running = True
+        self._thread = Thread(
+            target=self._receive_loop, name="tello_receiver", daemon=True
+        )
+        self._thread.start()
+    
+    @classmethod
+    def instance(cls) -> "TelloReceiver":
+        """Get the shared receiver, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+    
+    def register(self, host: str) -> _DroneLink:
+        """
+        Register a client of a drone and get the drone's link.
+        
+        Every client of the same drone shares one link; hold its lock for
+        each command/ACK exchange.
+        
+        Args:
+            host: Drone IP address.
+            
+        Returns:
+            Link whose queue receives raw responses from that drone.
+        """
+        with self._links_lock:
+            link = self._links.get(host)
+            if link is None:
+                link = self._links[host] = _DroneLink()
+            link.clients += 1
+            return link
+    
+    def unregister(self, host: str) -> None:
+        """
+        Unregister a client of a drone.
+        
+        Responses stop being routed once the drone's last client is gone.
+        
+        Args:
+            host: Drone IP address.
+        """
+        with self._links_lock:
+            link = self._links.get(host)
+            if link is None:
+                return
+            link.clients -= 1
+            if link.clients <= 0:
+                del self._links[host]
+    
+    def send(self, host: str, data: bytes, port: int = TELLO_COMMAND_PORT) -> None:
+        """Send raw command bytes to a drone."""
+        self._sock.sendto(data, (host, port))
+    
+    def close(self) -> None:
+        """Stop the receive thread and close the socket."""
+        self._running = False
+        self._thread.join(timeout=1.0)
+        self._selector.close()
+        self._sock.close()
+        with self._instance_lock:
+            if TelloReceiver._instance is self:
+                TelloReceiver._instance = None
+    
+    def _receive_loop(self) -> None:
+        """Demultiplex incoming packets to the per-drone queues."""
+        buf = bytearray(64)
+        
+        while self._running:
+            for _ in self._selector.select(timeout=0.2):
+                try:
+                    size, (host, _) = self._sock.recvfrom_into(buf)
+                except OSError:
+                    continue
+                
+                link = self._links.get(host)
+                if link is not None:
+                    link.acks.put(bytes(buf[:size]))
+
+
+class _FastTelloClient:
+    """
+    Minimal Tello command sender on the shared TelloReceiver socket.
+    
+    Mirrors the djitellopy method names used by the navigator, but checks
+    the raw ACK bytes instead of decoding and comparing strings. The Tello
+    replies to the sending port, so this does not interfere with
+    djitellopy's own socket.
+    """
+    
+    __slots__ = ("_host", "_port", "_receiver", "_link", "_timeout", "_closed")
+    
+    # Fixed commands encoded once
+    _FIXED = {
+        "takeoff": b"takeoff",
+        "land": b"land",
+        "emergency": b"emergency",
+        "stop": b"stop",
+        "rc_neutral": b"rc 0 0 0 0",
+    }
+    
+    def __init__(
+        self,
+        host: str,
+        port: int = TELLO_COMMAND_PORT,
+        timeout: float = COMMAND_TIMEOUT_SEC,
+    ):
+        self._host = host
+        self._port = port
+        self._receiver = TelloReceiver.instance()
+        self._link = self._receiver.register(host)
+        self._timeout = timeout
+        self._closed = False
+    
+    def close(self) -> None:
+        """Release this client's registration with the receiver."""
+        if not self._closed:
+            self._closed = True
+            self._receiver.unregister(self._host)
+    
+    def send_command(self, command: bytes) -> None:
+        """
+        Send a command and wait for its "ok".
+        
+        Args:
+            command: ASCII command bytes.
+            
+        Raises:
+            TimeoutError: If no response arrives in time.
+            TelloCommandError: If the drone responds with an error.
+        """
+        link = self._link
+        
+        with link.lock:
+            # Discard late ACKs from earlier timed-out commands; no other
+            # exchange with this drone is in flight while the lock is held
+            while not link.acks.empty():
+                link.acks.get_nowait()
+            
+            self._receiver.send(self._host, command, self._port)
+            
+            try:
+                response = link.acks.get(timeout=self._timeout)
+            except queue.Empty:
+                raise TimeoutError(f"No response to {command!r}") from None
+        
+        if response[:2] != b"ok":
+            raise TelloCommandError(
+                f"Command {command!r} failed: "
+                f"{response.decode('ascii', 'replace').strip()}"
+            )
+    
+    def takeoff(self) -> None:
+        self.send_command(self._FIXED["takeoff"])
+    
+    def land(self) -> None:
+        self.send_command(self._FIXED["land"])
+    
+    def emergency(self) -> None:
+        self.send_command(self._FIXED["emergency"])
+    
+    def set_speed(self, speed: int) -> None:
+        self.send_command(b"speed %d" % speed)
+    
+    def move_up(self, x: int) -> None:
+        self.send_command(b"up %d" % x)
+    
+    def move_down(self, x: int) -> None:
+        self.send_command(b"down %d" % x)
+    
+    def move_forward(self, x: int) -> None:
+        self.send_command(b"forward %d" % x)
+    
+    def move_back(self, x: int) -> None:
+        self.send_command(b"back %d" % x)
+    
+    def move_left(self, x: int) -> None:
+        self.send_command(b"left %d" % x)
+    
+    def move_right(self, x: int) -> None:
+        self.send_command(b"right %d" % x)
+    
+    def go_xyz_speed(self, x: int, y: int, z: int, speed: int) -> None:
+        self.send_command(b"go %d %d %d %d" % (x, y, z, speed))
+    
+    def rotate_clockwise(self, x: int) -> None:
+        self.send_command(b"cw %d" % x)
+    
+    def rotate_counter_clockwise(self, x: int) -> None:
+        self.send_command(b"ccw %d" % x)
 
 
 @dataclass
@@ -72,13 +573,34 @@ class FlightNavigator(LoggerMixin):
         self.tello = tello
         self.config = config or FlightConfig()
         
+        # Checked once so hot paths skip building debug messages
+        self._debug_on = self.logger.isEnabledFor(logging.DEBUG)
+        
         self._waypoints: List[Waypoint] = []
+        # Structure-of-arrays view for vectorized path math
+        self._waypoint_xyz = np.empty((0, 3), dtype=np.int16)
+        self._waypoint_names: List[str] = []
         self._current_waypoint_index = -1
         self._state = NavigationState.IDLE
         
         # Position tracking (relative to takeoff, in cm)
-        self._current_position = [0, 0, 0]  # x, y, z
-        self._home_position = [0, 0, 0]
+        self._current_position = np.zeros(3, dtype=np.int16)  # x, y, z
+        self._home_position = np.zeros(3, dtype=np.int16)
+        
+        # Local copy of the Tello state stream
+        self._telemetry = _TelemetryCache(tello)
+        
+        # Target for move/rotate commands (djitellopy or the fast client)
+        self._commands = self._make_command_client(tello)
+        
+        # Running estimate of the Wi-Fi command round-trip
+        self._avg_cmd_latency_sec = 0.05
+        
+        # Cleared if the firmware rejects "go" commands
+        self._go_supported = True
+        
+        # Retried attempts per command, for post-flight reporting
+        self._retry_stats: Counter = Counter()
         
         # Callbacks
         self._on_waypoint_reached: Optional[Callable[[Waypoint], None]] = None
@@ -93,8 +615,22 @@ class FlightNavigator(LoggerMixin):
             tello: DJITelloPy Tello instance.
         """
         self.tello = tello
+        self._telemetry.set_tello(tello)
+        if isinstance(self._commands, _FastTelloClient):
+            self._commands.close()
+        self._commands = self._make_command_client(tello)
         self.logger.debug("Tello instance set")
     
+    def _make_command_client(self, tello):
+        """Pick the object move and rotate commands are sent through."""
+        address = getattr(tello, "address", None)
+        if self.config.fast_commands and address is not None:
+            try:
+                return _FastTelloClient(address[0])
+            except OSError as e:
+                self.logger.warning(f"Fast command client unavailable: {e}")
+        return tello
+    
     def load_waypoints(self, waypoints: List[Waypoint]) -> None:
         """
         Load waypoints for the mission.
@@ -103,12 +639,30 @@ class FlightNavigator(LoggerMixin):
             waypoints: List of Waypoint objects.
         """
         self._waypoints = waypoints.copy()
+        self._waypoint_xyz = np.array(
+            [[w.x, w.y, w.z] for w in waypoints], dtype=np.int16
+        ).reshape(-1, 3)
+        
+        if self.config.optimize_order and len(waypoints) > 2:
+            before = self.total_path_length_cm()
+            order = _nearest_neighbor_order(self._waypoint_xyz)
+            self._waypoints = [self._waypoints[i] for i in order]
+            self._waypoint_xyz = self._waypoint_xyz[order]
+            self.logger.info(
+                f"Reordered waypoints: path {before:.0f}cm -> "
+                f"{self.total_path_length_cm():.0f}cm"
+            )
+        
+        self._waypoint_names = [w.name for w in self._waypoints]
         self._current_waypoint_index = -1
         self._state = NavigationState.IDLE
         
         self.logger.info(f"Loaded {len(waypoints)} waypoints")
-        for i, wp in enumerate(waypoints):
-            self.logger.debug(f"  [{i+1}] {wp.name}: ({wp.x}, {wp.y}, {wp.z})")
+        if self._debug_on:
+            for i, wp in enumerate(self._waypoints):
+                self.logger.debug(
+                    "  [%d] %s: (%d, %d, %d)", i + 1, wp.name, wp.x, wp.y, wp.z
+                )
     
     def set_waypoint_callback(
         self, 
@@ -139,16 +693,20 @@ class FlightNavigator(LoggerMixin):
             
             # Move to configured height
             target_height = self.config.takeoff_height_cm
-            current_height = self.tello.get_height()
+            if self._telemetry.refresh():
+                current_height = self._telemetry.height
+            else:
+                current_height = self.tello.get_height()
             
             if current_height < target_height:
                 height_diff = target_height - current_height
-                self.logger.debug(f"Adjusting height by +{height_diff}cm")
-                self.tello.move_up(height_diff)
+                if self._debug_on:
+                    self.logger.debug("Adjusting height by +%dcm", height_diff)
+                self._commands.move_up(height_diff)
             
             # Update position
-            self._current_position = [0, 0, target_height]
-            self._home_position = [0, 0, 0]
+            self._current_position[:] = (0, 0, target_height)
+            self._home_position[:] = 0
             
             # Wait for stability
             time.sleep(self.config.hover_stability_delay_sec)
@@ -209,15 +767,17 @@ class FlightNavigator(LoggerMixin):
             )
         
         self._current_waypoint_index += 1
-        waypoint = self._waypoints[self._current_waypoint_index]
+        index = self._current_waypoint_index
+        waypoint = self._waypoints[index]
         
         self.logger.info(
-            f"Navigating to waypoint {self._current_waypoint_index + 1}: {waypoint.name}"
+            f"Navigating to waypoint {index + 1}: {self._waypoint_names[index]}"
         )
         self._state = NavigationState.NAVIGATING
         
         try:
-            success = self._navigate_to_position(waypoint.x, waypoint.y, waypoint.z)
+            # tolist() yields plain ints for the Tello command strings
+            success = self._navigate_to_position(*self._waypoint_xyz[index].tolist())
             
             if success:
                 self._state = NavigationState.AT_WAYPOINT
@@ -248,6 +808,22 @@ class FlightNavigator(LoggerMixin):
                 error_message=str(e),
             )
     
+    async def navigate_to_next_async(self) -> NavigationResult:
+        """
+        Navigate to the next waypoint without blocking the event loop.
+        
+        djitellopy calls block until the ACK, so the synchronous
+        navigate_to_next runs in the default executor. This lets a caller
+        overlap the flight with other work, e.g.:
+        
+            await asyncio.gather(navigator.navigate_to_next_async(), upload())
+        
+        Returns:
+            NavigationResult with success status.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.navigate_to_next)
+    
     def return_home(self) -> bool:
         """
         Navigate back to home position (takeoff point).
@@ -259,10 +835,11 @@ class FlightNavigator(LoggerMixin):
         self._state = NavigationState.RETURNING_HOME
         
         try:
+            home_x, home_y, _ = self._home_position.tolist()
             success = self._navigate_to_position(
-                self._home_position[0],
-                self._home_position[1],
-                self._current_position[2],  # Maintain current height
+                home_x,
+                home_y,
+                int(self._current_position[2]),  # Maintain current height
             )
             
             if success:
@@ -289,14 +866,19 @@ class FlightNavigator(LoggerMixin):
             return self._waypoints[self._current_waypoint_index]
         return None
     
-    def get_current_position(self) -> Tuple[int, int, int]:
+    def get_current_position(self) -> np.ndarray:
         """
         Get estimated current position.
         
+        Returns a read-only view, so polling it does not allocate a new
+        container each call; it unpacks like the (x, y, z) tuple.
+        
         Returns:
-            Tuple of (x, y, z) in cm relative to takeoff point.
+            Array of (x, y, z) in cm relative to takeoff point.
         """
-        return tuple(self._current_position)
+        view = self._current_position.view()
+        view.flags.writeable = False
+        return view
     
     def get_state(self) -> NavigationState:
         """Get current navigation state."""
@@ -306,6 +888,20 @@ class FlightNavigator(LoggerMixin):
         """Get total number of waypoints."""
         return len(self._waypoints)
     
+    def get_retry_stats(self) -> Dict[str, int]:
+        """Get the number of retried attempts per command name."""
+        return dict(self._retry_stats)
+    
+    def total_path_length_cm(self) -> float:
+        """
+        Get the straight-line length of the waypoint path.
+        
+        Returns:
+            Sum of leg lengths between consecutive waypoints in cm.
+        """
+        legs = np.diff(self._waypoint_xyz.astype(np.float64), axis=0)
+        return float(np.linalg.norm(legs, axis=1).sum())
+    
     def rotate(self, degrees: int) -> bool:
         """
         Rotate the drone.
@@ -322,9 +918,9 @@ class FlightNavigator(LoggerMixin):
         
         try:
             if degrees > 0:
-                self.tello.rotate_clockwise(degrees)
+                self._commands.rotate_clockwise(degrees)
             else:
-                self.tello.rotate_counter_clockwise(abs(degrees))
+                self._commands.rotate_counter_clockwise(abs(degrees))
             return True
         except Exception as e:
             self.logger.error(f"Rotation failed: {e}")
@@ -353,41 +949,22 @@ class FlightNavigator(LoggerMixin):
             self.logger.error("Tello not connected")
             return False
         
-        # Calculate relative movements needed
-        dx = target_x - self._current_position[0]
-        dy = target_y - self._current_position[1]
-        dz = target_z - self._current_position[2]
+        # Set speed (also a cheap round-trip to sample command latency)
+        start = time.perf_counter()
+        self._commands.set_speed(self.config.movement_speed)
+        self._update_cmd_latency(time.perf_counter() - start)
         
-        self.logger.debug(
-            f"Moving from {self._current_position} to ({target_x}, {target_y}, {target_z})"
-        )
-        self.logger.debug(f"Relative movement: dx={dx}, dy={dy}, dz={dz}")
+        src = self._predict_position()
+        dst = (target_x, target_y, target_z)
         
-        # Set speed
-        self.tello.set_speed(self.config.movement_speed)
+        if self._debug_on:
+            self.logger.debug("Moving from %s to %s", src, dst)
         
-        # Execute movements (Z first for safety, then X/Y)
         try:
-            # Height adjustment
-            if dz > 0:
-                self._move_with_limit(self.tello.move_up, dz, "up")
-            elif dz < 0:
-                self._move_with_limit(self.tello.move_down, abs(dz), "down")
-            
-            # Forward/backward (X axis)
-            if dx > 0:
-                self._move_with_limit(self.tello.move_forward, dx, "forward")
-            elif dx < 0:
-                self._move_with_limit(self.tello.move_back, abs(dx), "back")
-            
-            # Left/right (Y axis)
-            if dy > 0:
-                self._move_with_limit(self.tello.move_right, dy, "right")
-            elif dy < 0:
-                self._move_with_limit(self.tello.move_left, abs(dy), "left")
+            self._fly(src, dst)
             
             # Update position tracking
-            self._current_position = [target_x, target_y, target_z]
+            self._current_position[:] = (target_x, target_y, target_z)
             
             return True
             
@@ -395,42 +972,145 @@ class FlightNavigator(LoggerMixin):
             self.logger.error(f"Movement failed: {e}")
             return False
     
-    def _move_with_limit(
-        self, 
-        move_func: Callable[[int], None], 
-        distance: int,
-        direction: str
-    ) -> None:
+    def _update_cmd_latency(self, sample_sec: float) -> None:
+        """Fold a command round-trip sample into the latency EMA."""
+        self._avg_cmd_latency_sec += LATENCY_EMA_ALPHA * (
+            sample_sec - self._avg_cmd_latency_sec
+        )
+    
+    def _predict_position(self) -> Tuple[int, int, int]:
+        """
+        Predict where the drone will be when the next command arrives.
+        
+        Extrapolates the tracked position by the current velocity over the
+        average command latency, so residual drift after a hover is not
+        carried into the next leg.
+        
+        Returns:
+            Predicted (x, y, z) in cm relative to takeoff.
+        """
+        x, y, z = self._current_position.tolist()
+        
+        if not self._telemetry.refresh():
+            return (x, y, z)
+        
+        t = self._avg_cmd_latency_sec
+        # Tello reports positive y velocity to the left
+        return (
+            x + round(self._telemetry.vgx * t),
+            y - round(self._telemetry.vgy * t),
+            z + round(self._telemetry.vgz * t),
+        )
+    
+    def _fly(self, src: Tuple[int, int, int], dst: Tuple[int, int, int]) -> None:
         """
-        Execute movement, splitting into chunks if needed.
+        Execute the planned moves from src to dst.
         
-        Tello has max movement of 500cm per command.
+        Falls back to axis-by-axis moves if the first "go" command is
+        rejected (older firmware). Any other failure, e.g. a timeout after
+        which the drone may already have moved, is raised so the leg is
+        not flown twice.
         
         Args:
-            move_func: Tello movement function.
-            distance: Distance in cm.
-            direction: Direction name for logging.
+            src: Current position (cm).
+            dst: Target position (cm).
         """
-        MAX_MOVE = 500  # cm
-        MIN_MOVE = 20   # cm (Tello minimum)
+        speed = self.config.movement_speed
         
-        remaining = distance
+        if self._go_supported:
+            plan = _plan_moves(src, dst, speed, True)
+            try:
+                self._execute_plan(plan[:1], end_of_leg=len(plan) == 1)
+            except _command_error_types() as e:
+                if not _is_rejection(e):
+                    raise
+                self.logger.warning(
+                    "go_xyz_speed not supported (%s), using axis moves", e
+                )
+                self._go_supported = False
+            else:
+                self._execute_plan(plan[1:])
+                return
         
-        while remaining > 0:
-            move_distance = min(remaining, MAX_MOVE)
-            
-            if move_distance < MIN_MOVE:
-                # Skip very small movements
-                self.logger.debug(f"Skipping small movement: {move_distance}cm {direction}")
-                break
+        self._execute_plan(_plan_moves(src, dst, speed, False))
+    
+    def _execute_plan(
+        self,
+        plan: Tuple[Tuple[str, Tuple[int, ...]], ...],
+        end_of_leg: bool = True,
+    ) -> None:
+        """
+        Send planned commands to the Tello in order.
+        
+        Args:
+            plan: (Tello method name, args) pairs from _plan_moves.
+            end_of_leg: Whether the plan's last command finishes the leg.
+                The waypoint hover follows it, so no settle wait is needed.
+        """
+        last = len(plan) - 1 if end_of_leg else len(plan)
+        
+        for i, (command, args) in enumerate(plan):
+            if self._debug_on:
+                self.logger.debug("%s%s", command, args)
+            self._send_with_retry(command, args)
             
-            self.logger.debug(f"Moving {move_distance}cm {direction}")
-            move_func(move_distance)
-            remaining -= move_distance
+            # djitellopy returns on the "ok" ACK; only wait for the drone
+            # to settle instead of a fixed delay between commands
+            if i < last:
+                self._await_motion_complete(MOTION_SETTLE_TIMEOUT_SEC)
+    
+    def _send_with_retry(self, command: str, args: Tuple[int, ...]) -> None:
+        """
+        Send a command, retrying with exponential backoff on error replies.
+        
+        Only commands the drone explicitly refused are resent. After a
+        timeout the move may already have run (djitellopy has also retried
+        it internally), so resending could repeat a relative move.
+        
+        Args:
+            command: Tello method name.
+            args: Command arguments.
             
-            # Small delay between chunked movements
-            if remaining > 0:
-                time.sleep(0.5)
+        Raises:
+            Exception: The command error once retries are exhausted, or
+                immediately if the command timed out.
+        """
+        send = getattr(self._commands, command)
+        
+        for attempt in range(COMMAND_ATTEMPTS):
+            try:
+                send(*args)
+                return
+            except _command_error_types() as e:
+                if attempt == COMMAND_ATTEMPTS - 1 or not _is_rejection(e):
+                    raise
+                self._retry_stats[command] += 1
+                self.logger.warning(
+                    "%s failed (%s), retry %d/%d",
+                    command, e, attempt + 1, COMMAND_ATTEMPTS - 1,
+                )
+                time.sleep(RETRY_BACKOFF_SEC * 2 ** attempt)
+    
+    def _await_motion_complete(self, timeout: float) -> None:
+        """
+        Wait until the drone reports zero velocity.
+        
+        Speeds come from the Tello state stream, so polling them does not
+        cost a command round-trip.
+        
+        Args:
+            timeout: Maximum time to wait in seconds.
+        """
+        deadline = time.monotonic() + timeout
+        telemetry = self._telemetry
+        
+        while time.monotonic() < deadline:
+            if not telemetry.refresh():
+                # No state available, rely on the command ACK alone
+                return
+            if not (telemetry.vgx or telemetry.vgy or telemetry.vgz):
+                return
+            time.sleep(0.02)
 
 
 class FlightNavigatorSimulator(FlightNavigator):
@@ -449,8 +1129,8 @@ class FlightNavigatorSimulator(FlightNavigator):
         """Simulate takeoff."""
         self.logger.info("[SIMULATED] Takeoff")
         target_height = self.config.takeoff_height_cm
-        self._current_position = [0, 0, target_height]
-        self._home_position = [0, 0, 0]
+        self._current_position[:] = (0, 0, target_height)
+        self._home_position[:] = 0
         time.sleep(1)  # Simulate takeoff time
         return True
     
@@ -479,9 +1159,10 @@ class FlightNavigatorSimulator(FlightNavigator):
         target_z: int
     ) -> bool:
         """Simulate navigation."""
-        dx = target_x - self._current_position[0]
-        dy = target_y - self._current_position[1]
-        dz = target_z - self._current_position[2]
+        x, y, z = self._current_position.tolist()
+        dx = target_x - x
+        dy = target_y - y
+        dz = target_z - z
         
         self.logger.info(
             f"[SIMULATED] Moving to ({target_x}, {target_y}, {target_z}) "
@@ -493,5 +1174,5 @@ class FlightNavigatorSimulator(FlightNavigator):
         sim_time = distance / 100.0
         time.sleep(min(sim_time, 3))  # Cap at 3 seconds
         
-        self._current_position = [target_x, target_y, target_z]
+        self._current_position[:] = (target_x, target_y, target_z)
         return True
@@ -4,8 +4,11 @@ Photo Capture Module for Drone Photography System.
 Handles multi-angle photography at each stopping point.
 """
 
+import asyncio
+import logging
 import time
-from typing import List, Tuple, Optional, Callable
+from concurrent.futures import Executor, Future
+from typing import List, Tuple, Optional, Callable, Union
 from dataclasses import dataclass
 
 import cv2
@@ -13,9 +16,19 @@ import numpy as np
 
 from ..utils.logger import get_logger, LoggerMixin
 from ..utils.storage import StorageManager
+from ..utils.executor import get_global_executor
+from ..utils.frame_buffer import LatestFrame
 from ..config import PhotoConfig, PhotoAngle
 
 
+# New frames to wait for once the drone has settled; the first one may
+# still have been decoded from video buffered mid-rotation
+SETTLED_FRAMES = 2
+
+# Longest wait for those frames before using whatever frame is current
+FRAME_WAIT_TIMEOUT_SEC = 1.0
+
+
 @dataclass
 class CaptureResult:
     """Result of a single photo capture."""
@@ -61,8 +74,21 @@ class PhotoCapture(LoggerMixin):
         self.storage = storage
         self.config = config or PhotoConfig()
         
+        # Level is fixed before modules start; skip per-shot debug formatting
+        self._debug_on = self.logger.isEnabledFor(logging.DEBUG)
+        
         self._rotation_func: Optional[Callable[[int], None]] = None
+        self._ccw_rotation_func: Optional[Callable[[int], None]] = None
+        self._frames: Optional[LatestFrame] = None
         self._delay_between_shots = self.config.delay_between_shots_sec
+        self._angle_order = self._sweep_order(self.config.angles)
+        
+        # One reusable frame buffer per angle; a capture keeps all of its
+        # frames alive until the saves finish, then the next stop reuses them
+        self._frame_bufs: List[Optional[np.ndarray]] = [None] * len(self.config.angles)
+        
+        # Encoding angle N overlaps the rotation to angle N+1
+        self._save_pool: Executor = get_global_executor()
         
         self.logger.info(
             f"PhotoCapture initialized with {len(self.config.angles)} angles"
@@ -70,7 +96,8 @@ class PhotoCapture(LoggerMixin):
     
     def set_rotation_function(
         self, 
-        rotate_func: Callable[[int], None]
+        rotate_func: Callable[[int], None],
+        ccw_func: Optional[Callable[[int], None]] = None,
     ) -> None:
         """
         Set the rotation function from flight controller.
@@ -78,10 +105,40 @@ class PhotoCapture(LoggerMixin):
         Args:
             rotate_func: Function that takes degrees and rotates drone.
                          Positive = clockwise, negative = counter-clockwise.
+                         If ccw_func is given, it is only called with
+                         positive clockwise degrees (e.g. rotate_clockwise).
+            ccw_func: Optional counter-clockwise function taking positive
+                      degrees (e.g. rotate_counter_clockwise).
         """
         self._rotation_func = rotate_func
+        self._ccw_rotation_func = ccw_func
         self.logger.debug("Rotation function set")
     
+    def set_io_executor(self, executor: Executor) -> None:
+        """
+        Use a shared executor for background photo encoding.
+        
+        Args:
+            executor: Executor owned (and shut down) by the caller.
+        """
+        self._save_pool = executor
+        self.logger.debug("I/O executor set")
+    
+    def set_frame_buffer(self, frames: LatestFrame) -> None:
+        """
+        Set the buffer the drone's frames are published to.
+        
+        The frame source only returns the newest frame, so reading it
+        right after a rotation can return a frame from mid-turn. With the
+        buffer set, each capture waits for frames published after the
+        drone has settled.
+        
+        Args:
+            frames: LatestFrame fed by the video stream.
+        """
+        self._frames = frames
+        self.logger.debug("Frame buffer set")
+    
     def capture_all_angles(
         self,
         frame_source: Callable[[], np.ndarray],
@@ -96,8 +153,8 @@ class PhotoCapture(LoggerMixin):
            a. Rotate to angle (if not front)
            b. Wait for stability
            c. Capture frame
-           d. Save photo
-        2. Return to original heading
+           d. Encode photo (in background, overlapping the next rotation)
+        2. Write all photos in one batch, then return to original heading
         
         Args:
             frame_source: Callable returning current video frame.
@@ -107,40 +164,77 @@ class PhotoCapture(LoggerMixin):
         Returns:
             List of CaptureResult for each angle.
         """
-        results: List[CaptureResult] = []
+        angles = self.config.angles
+        pending: List[Tuple[int, "Future[Union[memoryview, CaptureResult]]"]] = []
         current_rotation = 0  # Track cumulative rotation
         
         self.logger.info(
             f"Starting multi-angle capture for {structure_id} at stop {stop_number}"
         )
         
-        for angle in self.config.angles:
-            try:
-                result = self._capture_single_angle(
-                    frame_source=frame_source,
-                    structure_id=structure_id,
-                    stop_number=stop_number,
-                    angle=angle,
-                    current_rotation=current_rotation,
-                )
-                results.append(result)
-                
-                # Update rotation tracking
-                if result.success:
-                    current_rotation = angle.rotation
+        # Restore the heading even if a capture or write fails unexpectedly
+        try:
+            for index in self._angle_order:
+                angle = angles[index]
+                try:
+                    future = self._capture_single_angle(
+                        frame_source=frame_source,
+                        structure_id=structure_id,
+                        stop_number=stop_number,
+                        angle=angle,
+                        current_rotation=current_rotation,
+                        slot=index,
+                    )
+                    pending.append((index, future))
                     
-            except Exception as e:
-                self.logger.error(f"Error capturing angle {angle.name}: {e}")
-                results.append(CaptureResult(
-                    angle_name=angle.name,
-                    file_path="",
-                    success=False,
-                    error_message=str(e),
-                ))
-        
-        # Return to original heading
-        if current_rotation != 0:
-            self._rotate(-current_rotation)
+                    # Update rotation tracking (rotation done even if no frame)
+                    current_rotation = angle.rotation
+                        
+                except Exception as e:
+                    self.logger.error(f"Error capturing angle {angle.name}: {e}")
+                    pending.append((index, self._completed(CaptureResult(
+                        angle_name=angle.name,
+                        file_path="",
+                        success=False,
+                        error_message=str(e),
+                    ))))
+            
+            # Wait for background encodes; results keep the configured order
+            results: List[CaptureResult] = [None] * len(angles)  # type: ignore[list-item]
+            encoded: List[int] = []
+            batch: List[Tuple[memoryview, str, int, str]] = []
+            for index, future in pending:
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    self.logger.error(
+                        "Error encoding angle %s: %s", angles[index].name, e
+                    )
+                    outcome = CaptureResult(
+                        angle_name=angles[index].name,
+                        file_path="",
+                        success=False,
+                        error_message=str(e),
+                    )
+                
+                if isinstance(outcome, CaptureResult):
+                    results[index] = outcome
+                else:
+                    encoded.append(index)
+                    batch.append((outcome, structure_id, stop_number, angles[index].name))
+            
+            # Write the whole stop at once
+            for index, path in zip(encoded, self.storage.save_photos_batch(batch)):
+                results[index] = CaptureResult(
+                    angle_name=angles[index].name,
+                    file_path=str(path) if path is not None else "",
+                    success=path is not None,
+                    error_message=None if path is not None else "Failed to write photo",
+                )
+        finally:
+            # Return to original heading
+            if current_rotation != 0:
+                self._rotate(-current_rotation)
         
         successful = sum(1 for r in results if r.success)
         self.logger.info(
@@ -149,6 +243,31 @@ class PhotoCapture(LoggerMixin):
         
         return results
     
+    async def capture_all_angles_async(
+        self,
+        frame_source: Callable[[], np.ndarray],
+        structure_id: str,
+        stop_number: int,
+    ) -> List[CaptureResult]:
+        """
+        Capture all angles without blocking the event loop.
+        
+        Runs capture_all_angles in the default executor; see it for
+        details.
+        
+        Args:
+            frame_source: Callable returning current video frame.
+            structure_id: Structure ID from QR detection.
+            stop_number: Current waypoint number.
+            
+        Returns:
+            List of CaptureResult for each angle.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.capture_all_angles, frame_source, structure_id, stop_number
+        )
+    
     def capture_single_frame(
         self,
         frame_source: Callable[[], np.ndarray],
@@ -169,7 +288,7 @@ class PhotoCapture(LoggerMixin):
             CaptureResult with capture details.
         """
         try:
-            frame = frame_source()
+            frame = self._grab_fresh_frame(frame_source)
             if frame is None:
                 return CaptureResult(
                     angle_name=angle_name,
@@ -207,16 +326,25 @@ class PhotoCapture(LoggerMixin):
         stop_number: int,
         angle: PhotoAngle,
         current_rotation: int,
-    ) -> CaptureResult:
+        slot: int,
+    ) -> "Future[Union[memoryview, CaptureResult]]":
         """
         Capture photo at a single angle.
         
+        Rotation and frame grab happen on the calling thread; JPEG encoding
+        is handed to the save pool.
+        
         Args:
             frame_source: Callable returning current frame.
             structure_id: Structure ID.
             stop_number: Stop number.
             angle: PhotoAngle definition.
             current_rotation: Current rotation from original heading.
+            slot: Index of the frame buffer to copy the frame into.
+            
+        Returns:
+            Future resolving to the encoded JPEG, or to a failed
+            CaptureResult if no frame was captured.
         """
         # Calculate rotation needed
         rotation_needed = angle.rotation - current_rotation
@@ -229,30 +357,59 @@ class PhotoCapture(LoggerMixin):
             time.sleep(self._delay_between_shots)
         
         # Capture frame
-        frame = frame_source()
+        frame = self._grab_fresh_frame(frame_source)
         if frame is None:
-            return CaptureResult(
+            return self._completed(CaptureResult(
                 angle_name=angle.name,
                 file_path="",
                 success=False,
                 error_message="No frame available",
-            )
+            ))
         
-        # Save photo
-        path = self.storage.save_frame(
-            frame=frame,
-            structure_id=structure_id,
-            stop_number=stop_number,
-            angle_name=angle.name,
+        # Encode in the background while the drone rotates to the next
+        # angle. Copy since the frame source may reuse its buffer.
+        return self._save_pool.submit(
+            self.storage.encode_frame, self._copy_to_slot(slot, frame)
         )
+    
+    def _copy_to_slot(self, slot: int, frame: np.ndarray) -> np.ndarray:
+        """Copy a frame into a reusable buffer, reallocating on shape change."""
+        buf = self._frame_bufs[slot]
+        if buf is None or buf.shape != frame.shape or buf.dtype != frame.dtype:
+            buf = np.empty_like(frame)
+            self._frame_bufs[slot] = buf
+        np.copyto(buf, frame)
+        return buf
+    
+    def _grab_fresh_frame(
+        self,
+        frame_source: Callable[[], np.ndarray],
+    ) -> Optional[np.ndarray]:
+        """
+        Get a frame captured after this call, if a frame buffer is set.
         
-        self.logger.debug(f"Captured {angle.name} at {path}")
-        
-        return CaptureResult(
-            angle_name=angle.name,
-            file_path=str(path),
-            success=True,
-        )
+        Args:
+            frame_source: Callable returning current frame.
+            
+        Returns:
+            Frame from frame_source, or None if none is available.
+        """
+        frames = self._frames
+        if frames is not None:
+            target = frames.sequence + SETTLED_FRAMES - 1
+            if not frames.wait_newer(target, FRAME_WAIT_TIMEOUT_SEC):
+                self.logger.warning(
+                    "No new frame within %.1fs, using the last one",
+                    FRAME_WAIT_TIMEOUT_SEC,
+                )
+        return frame_source()
+    
+    @staticmethod
+    def _completed(result: CaptureResult) -> "Future[Union[memoryview, CaptureResult]]":
+        """Wrap an immediate result in a finished Future."""
+        future: "Future[Union[memoryview, CaptureResult]]" = Future()
+        future.set_result(result)
+        return future
     
     def _rotate(self, degrees: int) -> None:
         """
@@ -267,15 +424,51 @@ class PhotoCapture(LoggerMixin):
             )
             return
         
-        self.logger.debug(f"Rotating {degrees}°")
+        if self._debug_on:
+            self.logger.debug("Rotating %d°", degrees)
         
-        # Split into multiple calls if needed (Tello max is usually 360)
-        if degrees > 0:
+        if self._ccw_rotation_func is None:
+            # Single signed rotation function
             self._rotation_func(degrees)
-        else:
-            # Negative rotation = counter-clockwise
-            # Tello uses rotate_counter_clockwise for negative
+        elif degrees > 0:
             self._rotation_func(degrees)
+        else:
+            self._ccw_rotation_func(-degrees)
+    
+    @staticmethod
+    def _sweep_order(angles: List[PhotoAngle]) -> List[int]:
+        """
+        Order angles to minimize the final return-to-heading rotation.
+        
+        Sweeps out to the side with the larger extent first, then across
+        to the other side, so the return rotation at the end covers the
+        smaller extent. Angles on each side are visited nearest-first.
+        
+        Args:
+            angles: Configured photo angles.
+            
+        Returns:
+            Indices into angles in visiting order.
+        """
+        indices = range(len(angles))
+        left = sorted(
+            (i for i in indices if angles[i].rotation <= 0),
+            key=lambda i: -angles[i].rotation,
+        )
+        right = sorted(
+            (i for i in indices if angles[i].rotation > 0),
+            key=lambda i: angles[i].rotation,
+        )
+        
+        left_extent = -angles[left[-1]].rotation if left else 0
+        right_extent = angles[right[-1]].rotation if right else 0
+        
+        if right_extent > left_extent:
+            # Keep the zero-rotation shot first when sweeping right
+            front = [i for i in left if angles[i].rotation == 0]
+            left = [i for i in left if angles[i].rotation != 0]
+            return front + right + left
+        return left + right
 
 
 class PhotoCaptureSimulator(PhotoCapture):
@@ -332,9 +525,8 @@ class PhotoCaptureSimulator(PhotoCapture):
         angle_name: str,
     ) -> np.ndarray:
         """Create a placeholder image with text."""
-        # Create blank image
-        img = np.zeros((720, 960, 3), dtype=np.uint8)
-        img[:] = (50, 50, 50)  # Dark gray background
+        # Dark gray background, filled in a single pass
+        img = np.full((720, 960, 3), 50, dtype=np.uint8)
         
         # Add text
         text_lines = [
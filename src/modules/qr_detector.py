@@ -5,8 +5,7 @@ Detects and decodes QR codes from the video stream to identify
 steel structures at stopping points.
 """
 
-import time
-from typing import Optional, Tuple, Callable
+from typing import Any, List, Optional, Tuple, Callable
 from threading import Thread, Event
 
 import cv2
@@ -16,12 +15,24 @@ try:
     from pyzbar import pyzbar
     from pyzbar.pyzbar import ZBarSymbol
     PYZBAR_AVAILABLE = True
+    # Symbol filter shared by every decode call
+    _QR_SYMBOLS = (ZBarSymbol.QRCODE,)
 except ImportError:
+    # Also raised when the bindings are installed but libzbar is missing
     PYZBAR_AVAILABLE = False
+    _QR_SYMBOLS = ()
 
 from ..utils.logger import get_logger, LoggerMixin
 
 
+# Consecutive downscaled misses before also trying full resolution
+FULL_RES_AFTER_MISSES = 3
+
+# Thumbnail size and dropped low bits for the unchanged-scene check
+SCENE_HASH_SIZE = (32, 32)
+SCENE_HASH_SHIFT = 3
+
+
 class QRDetector(LoggerMixin):
     """
     Detects QR codes from video frames.
@@ -44,34 +55,60 @@ class QRDetector(LoggerMixin):
         detector.stop_detection()
     """
     
-    def __init__(self, fallback_id: str = "UNKNOWN"):
+    def __init__(
+        self,
+        fallback_id: str = "UNKNOWN",
+        use_pyzbar: bool = False,
+        scan_scale: float = 0.5,
+    ):
         """
         Initialize QR detector.
         
         Args:
             fallback_id: ID to return when no QR is detected.
+            use_pyzbar: Decode with pyzbar instead of OpenCV's native
+                        QRCodeDetector.
+            scan_scale: Downscale factor applied before decoding
+                        (1.0 = full resolution).
         """
-        if not PYZBAR_AVAILABLE:
+        if use_pyzbar and not PYZBAR_AVAILABLE:
             raise ImportError(
                 "pyzbar is required for QR detection. "
                 "Install with: pip install pyzbar"
             )
         
         self.fallback_id = fallback_id
+        self.use_pyzbar = use_pyzbar
+        self.scan_scale = scan_scale
+        self._cv_detector = cv2.QRCodeDetector()
+        self._scaled_misses = 0
+        # Hash of the last fully scanned scene, see _detection_loop
+        self._last_scene_hash: Optional[int] = None
+        # Reused polygon for drawing detections
+        self._poly_buf = np.empty((1, 4, 2), dtype=np.int32)
         self._detection_thread: Optional[Thread] = None
         self._stop_event = Event()
+        # Set on detection (or stop) so waiters wake immediately
+        self._detected_event = Event()
         self._detected_data: Optional[str] = None
+        # Set by the frame producer when a new frame is available
+        self._new_frame_event = Event()
         self._detection_callback: Optional[Callable[[str], None]] = None
         self._frame_source: Optional[Callable[[], np.ndarray]] = None
         
         self.logger.info("QRDetector initialized")
     
-    def detect_from_frame(self, frame: np.ndarray) -> Optional[str]:
+    def detect_from_frame(
+        self,
+        frame: np.ndarray,
+        gray: Optional[np.ndarray] = None,
+    ) -> Optional[str]:
         """
         Detect and decode QR code from a single frame.
         
         Args:
-            frame: OpenCV frame (BGR numpy array).
+            frame: OpenCV frame (BGR or grayscale numpy array).
+            gray: Grayscale version of frame, if the caller already has one.
             
         Returns:
             Decoded QR data string, or None if not found.
@@ -80,58 +117,81 @@ class QRDetector(LoggerMixin):
             return None
         
         # Convert to grayscale for better detection
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if gray is None:
+            gray = self._to_gray(frame)
         
-        # Detect QR codes
-        decoded_objects = pyzbar.decode(gray, symbols=[ZBarSymbol.QRCODE])
+        if self.scan_scale >= 1.0:
+            data = self._decode_first(gray)
+        else:
+            # Scan cost is proportional to pixels; QR modules stay well
+            # above the decoder's minimum size at half resolution
+            small = cv2.resize(
+                gray, None, fx=self.scan_scale, fy=self.scan_scale,
+                interpolation=cv2.INTER_AREA,
+            )
+            data = self._decode_first(small)
+            
+            if data is not None:
+                self._scaled_misses = 0
+            else:
+                # Code too small at reduced size; stay on full resolution
+                # while it keeps decoding there
+                self._scaled_misses += 1
+                if self._scaled_misses >= FULL_RES_AFTER_MISSES:
+                    data = self._decode_first(gray)
+                    if data is None:
+                        self._scaled_misses = 0
         
-        if decoded_objects:
-            # Return first detected QR
-            data = decoded_objects[0].data.decode('utf-8')
+        if data is not None:
             self.logger.debug(f"QR detected: {data}")
-            return data
         
-        return None
+        return data
     
     def detect_with_visualization(
         self, 
-        frame: np.ndarray
+        frame: np.ndarray,
+        gray: Optional[np.ndarray] = None,
     ) -> Tuple[Optional[str], np.ndarray]:
         """
         Detect QR code and return frame with visualization overlay.
         
         Args:
             frame: OpenCV frame (BGR numpy array).
+            gray: Grayscale version of frame, if the caller already has one.
             
         Returns:
-            Tuple of (detected_data, frame_with_overlay).
+            Tuple of (detected_data, frame_with_overlay). The input frame
+            itself is returned when nothing was detected.
         """
         if frame is None:
             return None, frame
         
-        output_frame = frame.copy()
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        decoded_objects = pyzbar.decode(gray, symbols=[ZBarSymbol.QRCODE])
+        if gray is None:
+            gray = self._to_gray(frame)
         
-        detected_data = None
+        decoded = self._decode_all(gray)
+        if not decoded:
+            # Nothing to draw, skip the full-frame copy
+            return None, frame
+        
+        output_frame = frame.copy()
+        detected_data = decoded[0][0]
         
-        for obj in decoded_objects:
-            # Draw bounding polygon
-            points = obj.polygon
-            if len(points) == 4:
-                pts = np.array(points, dtype=np.int32)
-                cv2.polylines(output_frame, [pts], True, (0, 255, 0), 3)
+        poly = self._poly_buf
+        for data, pts in decoded:
+            if len(pts) == 4:
+                # Draw bounding polygon (assignment truncates to int32 in place)
+                poly[0] = pts
+                cv2.polylines(output_frame, poly, True, (0, 255, 0), 3)
+                left, top = poly[0].min(axis=0)
+            else:
+                left, top = np.min(pts, axis=0)
             
             # Draw data text
-            data = obj.data.decode('utf-8')
-            if detected_data is None:
-                detected_data = data
-            
-            rect = obj.rect
             cv2.putText(
                 output_frame,
                 data,
-                (rect.left, rect.top - 10),
+                (int(left), int(top) - 10),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 0.8,
                 (0, 255, 0),
@@ -140,6 +200,60 @@ class QRDetector(LoggerMixin):
         
         return detected_data, output_frame
     
+    @staticmethod
+    def _to_gray(frame: np.ndarray) -> np.ndarray:
+        """Convert a BGR frame to grayscale (Rec.601), passing gray through."""
+        if frame.ndim == 2:
+            return frame
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    
+    @staticmethod
+    def _scene_hash(gray: np.ndarray) -> int:
+        """Hash a coarse thumbnail so sensor noise doesn't count as change."""
+        thumb = cv2.resize(gray, SCENE_HASH_SIZE, interpolation=cv2.INTER_AREA)
+        return hash((thumb >> SCENE_HASH_SHIFT).tobytes())
+    
+    @staticmethod
+    def _zbar_image(gray: np.ndarray) -> Tuple[bytes, int, int]:
+        """
+        Pack a grayscale frame as pyzbar's (pixels, width, height) input.
+        
+        Given an ndarray, pyzbar runs astype() and then tobytes(), copying
+        the frame twice; uint8 gray only needs the single tobytes() copy.
+        """
+        return gray.tobytes(), gray.shape[1], gray.shape[0]
+    
+    def _decode_first(self, gray: np.ndarray) -> Optional[str]:
+        """Decode the first QR code in a grayscale frame, if any."""
+        if self.use_pyzbar:
+            decoded_objects = pyzbar.decode(self._zbar_image(gray), symbols=_QR_SYMBOLS)
+            # pyzbar returns bytes
+            return decoded_objects[0].data.decode('utf-8') if decoded_objects else None
+        
+        # OpenCV returns str, empty when nothing was decoded
+        return self._cv_detector.detectAndDecode(gray)[0] or None
+    
+    def _decode_all(self, gray: np.ndarray) -> List[Tuple[str, Any]]:
+        """
+        Decode every QR code in a grayscale frame.
+        
+        Args:
+            gray: Grayscale frame.
+            
+        Returns:
+            List of (data, corner points as an Nx2 sequence).
+        """
+        if self.use_pyzbar:
+            return [
+                (obj.data.decode('utf-8'), obj.polygon)
+                for obj in pyzbar.decode(self._zbar_image(gray), symbols=_QR_SYMBOLS)
+            ]
+        
+        ok, decoded, points, _ = self._cv_detector.detectAndDecodeMulti(gray)
+        if not ok or points is None:
+            return []
+        return [(data, pts) for data, pts in zip(decoded, points) if data]
+    
     def start_detection(
         self,
         frame_source: Callable[[], np.ndarray],
@@ -159,6 +273,8 @@ class QRDetector(LoggerMixin):
         self._frame_source = frame_source
         self._detection_callback = callback
         self._detected_data = None
+        self._last_scene_hash = None
+        self._detected_event.clear()
         self._stop_event.clear()
         
         self._detection_thread = Thread(target=self._detection_loop, daemon=True)
@@ -169,6 +285,8 @@ class QRDetector(LoggerMixin):
     def stop_detection(self) -> None:
         """Stop continuous QR detection."""
         self._stop_event.set()
+        self._detected_event.set()
+        self._new_frame_event.set()
         
         if self._detection_thread is not None:
             self._detection_thread.join(timeout=2.0)
@@ -176,6 +294,15 @@ class QRDetector(LoggerMixin):
         
         self.logger.info("Stopped QR detection")
     
+    def notify_new_frame(self) -> None:
+        """
+        Signal that the frame source has a new frame.
+        
+        Call from the camera thread on each frame so the detection loop
+        runs once per frame instead of on a fixed 100ms poll.
+        """
+        self._new_frame_event.set()
+    
     def wait_for_detection(self, timeout_sec: float = 3.0) -> str:
         """
         Wait for QR detection or timeout.
@@ -186,18 +313,12 @@ class QRDetector(LoggerMixin):
         Returns:
             Detected QR data or fallback_id if timeout.
         """
-        start_time = time.time()
+        self._detected_event.wait(timeout_sec)
         
-        while time.time() - start_time < timeout_sec:
-            if self._detected_data is not None:
-                result = self._detected_data
-                self.logger.info(f"QR detected: {result}")
-                return result
-            
-            if self._stop_event.is_set():
-                break
-            
-            time.sleep(0.1)
+        result = self._detected_data
+        if result is not None:
+            self.logger.info(f"QR detected: {result}")
+            return result
         
         self.logger.warning(f"QR detection timeout, using fallback: {self.fallback_id}")
         return self.fallback_id
@@ -220,15 +341,28 @@ class QRDetector(LoggerMixin):
         while not self._stop_event.is_set():
             try:
                 if self._frame_source is None:
-                    time.sleep(0.1)
+                    self._new_frame_event.wait(timeout=0.1)
+                    self._new_frame_event.clear()
                     continue
                 
                 frame = self._frame_source()
                 if frame is not None:
-                    data = self.detect_from_frame(frame)
+                    gray = self._to_gray(frame)
+                    scene_hash = self._scene_hash(gray)
+                    
+                    if scene_hash == self._last_scene_hash:
+                        # Hovering over the same view, already scanned
+                        data = None
+                    else:
+                        data = self.detect_from_frame(frame, gray)
+                        # Only a hit or a full-resolution miss settles a
+                        # scene; scaled misses must reach the fallback
+                        if self._scaled_misses == 0:
+                            self._last_scene_hash = scene_hash
                     
                     if data is not None:
                         self._detected_data = data
+                        self._detected_event.set()
                         
                         if self._detection_callback:
                             self._detection_callback(data)
@@ -236,11 +370,13 @@ class QRDetector(LoggerMixin):
                         # Continue running to allow multiple detections
                         # Remove break if you want single-shot behavior
                 
-                time.sleep(0.1)  # ~10 FPS detection rate
+                # Next frame, or ~10 FPS if the producer never notifies
+                self._new_frame_event.wait(timeout=0.1)
+                self._new_frame_event.clear()
                 
             except Exception as e:
                 self.logger.error(f"Detection loop error: {e}")
-                time.sleep(0.5)
+                self._stop_event.wait(0.5)
 
 
 # Standalone test function
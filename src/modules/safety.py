@@ -27,6 +27,20 @@ from ..utils.logger import get_logger, LoggerMixin
 from ..config import SafetyConfig
 
 
+# Pose inference input size; landmarks are normalized, so the gesture
+# logic is unaffected by the downscale
+POSE_INPUT_SIZE = (320, 240)
+
+# Run pose on every Nth monitored frame, reusing the last result between
+POSE_FRAME_STRIDE = 2
+
+# Upper-body motion gate: pose runs on every stride frame only while the
+# thumbnail changes by more than this many gray levels, else at ~2 Hz
+MOTION_THUMB_SIZE = (80, 60)
+MOTION_DIFF_THRESHOLD = 25
+POSE_IDLE_INTERVAL_SEC = 0.5
+
+
 class EmergencyGesture(Enum):
     """Supported emergency gestures."""
     CROSSED_ARMS = "crossed_arms"
@@ -81,12 +95,22 @@ class SafetyModule(LoggerMixin):
         self._status = SafetyStatus()
         self._monitoring_thread: Optional[Thread] = None
         self._stop_event = Event()
+        # Set by the frame producer when a new frame is available
+        self._new_frame_event = Event()
         self._frame_source: Optional[Callable[[], np.ndarray]] = None
         self._emergency_callback: Optional[Callable[[], None]] = None
         self._emergency_triggered = False
         self._pose = None
         self._mp_pose = None
         self._mp_draw = None
+        self._landmark_ids: Tuple[int, ...] = ()
+        # Motion gate state, see _pose_due
+        self._prev_motion_thumb: Optional[np.ndarray] = None
+        self._last_pose_time = 0.0
+        # Pose input buffers, reused every inference
+        width, height = POSE_INPUT_SIZE
+        self._pose_small = np.empty((height, width, 3), dtype=np.uint8)
+        self._pose_rgb = np.empty((height, width, 3), dtype=np.uint8)
         
         # Initialize MediaPipe Pose for gesture detection
         if MEDIAPIPE_AVAILABLE and mp is not None:
@@ -97,6 +121,17 @@ class SafetyModule(LoggerMixin):
                     min_tracking_confidence=0.5,
                 )
                 self._mp_draw = mp.solutions.drawing_utils
+                
+                # Resolve enum members once instead of per frame
+                landmark = self._mp_pose.PoseLandmark
+                self._landmark_ids = (
+                    landmark.LEFT_WRIST.value,
+                    landmark.RIGHT_WRIST.value,
+                    landmark.LEFT_SHOULDER.value,
+                    landmark.RIGHT_SHOULDER.value,
+                    landmark.LEFT_ELBOW.value,
+                    landmark.RIGHT_ELBOW.value,
+                )
             except AttributeError:
                 # MediaPipe available but solutions not accessible
                 self.logger.warning(
@@ -141,6 +176,7 @@ class SafetyModule(LoggerMixin):
         self._frame_source = frame_source
         self._stop_event.clear()
         self._emergency_triggered = False
+        self._prev_motion_thumb = None
         
         self._monitoring_thread = Thread(target=self._monitoring_loop, daemon=True)
         self._monitoring_thread.start()
@@ -150,6 +186,7 @@ class SafetyModule(LoggerMixin):
     def stop_monitoring(self) -> None:
         """Stop background safety monitoring."""
         self._stop_event.set()
+        self._new_frame_event.set()
         
         if self._monitoring_thread is not None:
             self._monitoring_thread.join(timeout=2.0)
@@ -157,6 +194,16 @@ class SafetyModule(LoggerMixin):
         
         self.logger.info("Stopped safety monitoring")
     
+    def notify_new_frame(self) -> None:
+        """
+        Signal that the frame source has a new frame.
+        
+        Call from the camera thread on each frame. The monitoring loop
+        checks at most once per gesture_check_interval_sec, on the first
+        frame to arrive after the interval has passed.
+        """
+        self._new_frame_event.set()
+    
     def is_emergency_triggered(self) -> bool:
         """Check if emergency gesture was detected."""
         return self._emergency_triggered
@@ -169,12 +216,20 @@ class SafetyModule(LoggerMixin):
         """Get current safety status."""
         return self._status
     
-    def check_frame(self, frame: np.ndarray) -> SafetyStatus:
+    def check_frame(
+        self,
+        frame: np.ndarray,
+        check_gesture: bool = True,
+        gray: Optional[np.ndarray] = None,
+    ) -> SafetyStatus:
         """
         Perform safety checks on a single frame.
         
         Args:
             frame: OpenCV frame (BGR numpy array).
+            check_gesture: Run pose-based gesture detection. When False the
+                           gesture fields are left at their defaults.
+            gray: Grayscale version of frame, if the caller already has one.
             
         Returns:
             SafetyStatus with detection results.
@@ -186,12 +241,12 @@ class SafetyModule(LoggerMixin):
         
         # Check for obstacles
         if self.config.obstacle_check_enabled:
-            obstacle, region = self._detect_obstacle(frame)
+            obstacle, region = self._detect_obstacle(frame, gray)
             status.obstacle_detected = obstacle
             status.obstacle_region = region
         
         # Check for emergency gesture
-        if self._pose is not None:
+        if self._pose is not None and check_gesture:
             gesture_detected, confidence = self._detect_crossed_arms(frame)
             status.emergency_gesture_detected = gesture_detected
             status.confidence = confidence
@@ -200,95 +255,175 @@ class SafetyModule(LoggerMixin):
     
     def check_frame_with_visualization(
         self, 
-        frame: np.ndarray
+        frame: np.ndarray,
+        gray: Optional[np.ndarray] = None,
     ) -> Tuple[SafetyStatus, np.ndarray]:
         """
         Check frame and return with visualization overlay.
         
         Args:
             frame: Input frame.
+            gray: Grayscale version of frame, if the caller already has one.
             
         Returns:
-            Tuple of (SafetyStatus, frame_with_overlay).
+            Tuple of (SafetyStatus, frame_with_overlay). The input frame
+            itself is returned when there is nothing to draw.
         """
         if frame is None:
             return SafetyStatus(), frame
         
-        output_frame = frame.copy()
         status = SafetyStatus()
+        landmarks = None
         
-        # Obstacle detection visualization
         if self.config.obstacle_check_enabled:
-            obstacle, region = self._detect_obstacle(frame)
+            obstacle, region = self._detect_obstacle(frame, gray)
             status.obstacle_detected = obstacle
             status.obstacle_region = region
-            
-            if obstacle:
-                # Draw warning overlay
-                cv2.putText(
-                    output_frame,
-                    f"OBSTACLE: {region}",
-                    (10, 60),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    1,
-                    (0, 0, 255),
-                    2,
-                )
         
-        # Gesture detection with visualization
         if self._pose is not None:
             gesture_detected, confidence, landmarks = self._detect_crossed_arms_with_landmarks(frame)
             status.emergency_gesture_detected = gesture_detected
             status.confidence = confidence
-            
-            # Draw pose landmarks if detected
-            if landmarks is not None:
-                self._mp_draw.draw_landmarks(
-                    output_frame,
-                    landmarks,
-                    self._mp_pose.POSE_CONNECTIONS,
-                )
-            
-            if gesture_detected:
-                cv2.putText(
-                    output_frame,
-                    f"EMERGENCY GESTURE ({confidence:.2f})",
-                    (10, 30),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    1,
-                    (0, 0, 255),
-                    2,
-                )
+        
+        if not (
+            status.obstacle_detected
+            or status.emergency_gesture_detected
+            or landmarks is not None
+        ):
+            # Nothing to draw, skip the full-frame copy
+            return status, frame
+        
+        output_frame = frame.copy()
+        
+        # Obstacle warning overlay
+        if status.obstacle_detected:
+            cv2.putText(
+                output_frame,
+                f"OBSTACLE: {status.obstacle_region}",
+                (10, 60),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (0, 0, 255),
+                2,
+            )
+        
+        # Draw pose landmarks if detected
+        if landmarks is not None:
+            self._mp_draw.draw_landmarks(
+                output_frame,
+                landmarks,
+                self._mp_pose.POSE_CONNECTIONS,
+            )
+        
+        if status.emergency_gesture_detected:
+            cv2.putText(
+                output_frame,
+                f"EMERGENCY GESTURE ({status.confidence:.2f})",
+                (10, 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (0, 0, 255),
+                2,
+            )
         
         return status, output_frame
     
     def _monitoring_loop(self) -> None:
         """Background monitoring loop."""
+        # OpenCV and MediaPipe release the GIL inside their C calls; keep
+        # the Python work between them to local lookups
         check_interval = self.config.gesture_check_interval_sec
+        confidence_threshold = self.config.gesture_confidence_threshold
+        check_frame = self.check_frame
+        frame_count = 0
+        last_frame = None
+        next_check = 0.0
         
         while not self._stop_event.is_set():
             try:
+                # check_interval is the minimum period between checks; only
+                # once it has passed, wait for the next frame to arrive
+                delay = next_check - time.monotonic()
+                if delay > 0 and self._stop_event.wait(delay):
+                    break
+                self._wait_for_frame(check_interval)
+                
                 if self._frame_source is None:
-                    time.sleep(check_interval)
                     continue
                 
                 frame = self._frame_source()
-                if frame is not None:
-                    self._status = self.check_frame(frame)
+                # Producers hand over a new array per frame, so an identical
+                # object means the stream has not advanced; keep the status
+                if frame is not None and frame is not last_frame:
+                    last_frame = frame
+                    next_check = time.monotonic() + check_interval
+                    
+                    # Obstacles every check; pose is far more expensive
+                    check_gesture = (
+                        frame_count % POSE_FRAME_STRIDE == 0
+                        and self._pose is not None
+                        and self._pose_due(frame)
+                    )
+                    frame_count += 1
+                    
+                    status = check_frame(frame, check_gesture=check_gesture)
+                    if not check_gesture:
+                        status.emergency_gesture_detected = (
+                            self._status.emergency_gesture_detected
+                        )
+                        status.confidence = self._status.confidence
+                    self._status = status
                     
                     # Handle emergency gesture
                     if (
-                        self._status.emergency_gesture_detected 
-                        and self._status.confidence >= self.config.gesture_confidence_threshold
+                        status.emergency_gesture_detected 
+                        and status.confidence >= confidence_threshold
                         and not self._emergency_triggered
                     ):
                         self._trigger_emergency()
                 
-                time.sleep(check_interval)
-                
             except Exception as e:
                 self.logger.error(f"Monitoring loop error: {e}")
-                time.sleep(0.5)
+                self._stop_event.wait(0.5)
+    
+    def _pose_due(self, frame: np.ndarray) -> bool:
+        """
+        Decide whether to run pose inference on this frame.
+        
+        Compares the upper two thirds of the frame (where a raised-arm
+        gesture happens) against the previous check using a small
+        grayscale thumbnail. Without motion, pose only runs every
+        POSE_IDLE_INTERVAL_SEC.
+        
+        Args:
+            frame: Input frame.
+            
+        Returns:
+            True if pose should run now.
+        """
+        upper_body = frame[: frame.shape[0] * 2 // 3]
+        thumb = cv2.resize(upper_body, MOTION_THUMB_SIZE, interpolation=cv2.INTER_AREA)
+        if thumb.ndim == 3:
+            thumb = cv2.cvtColor(thumb, cv2.COLOR_BGR2GRAY)
+        
+        prev_thumb = self._prev_motion_thumb
+        self._prev_motion_thumb = thumb
+        
+        now = time.monotonic()
+        moved = (
+            prev_thumb is None
+            or cv2.absdiff(thumb, prev_thumb).max() > MOTION_DIFF_THRESHOLD
+        )
+        
+        if moved or now - self._last_pose_time >= POSE_IDLE_INTERVAL_SEC:
+            self._last_pose_time = now
+            return True
+        return False
+    
+    def _wait_for_frame(self, timeout: float) -> None:
+        """Block until a new frame is signalled or timeout elapses."""
+        self._new_frame_event.wait(timeout=timeout)
+        self._new_frame_event.clear()
     
     def _trigger_emergency(self) -> None:
         """Handle emergency trigger."""
@@ -303,7 +438,8 @@ class SafetyModule(LoggerMixin):
     
     def _detect_obstacle(
         self, 
-        frame: np.ndarray
+        frame: np.ndarray,
+        gray: Optional[np.ndarray] = None,
     ) -> Tuple[bool, Optional[str]]:
         """
         Simple obstacle detection based on frame analysis.
@@ -315,6 +451,7 @@ class SafetyModule(LoggerMixin):
         
         Args:
             frame: Input frame.
+            gray: Grayscale version of frame; cropped instead of converting.
             
         Returns:
             Tuple of (obstacle_detected, region).
@@ -327,14 +464,25 @@ class SafetyModule(LoggerMixin):
         center_y1 = int(height * 0.3)
         center_y2 = int(height * 0.7)
         
-        center_region = frame[center_y1:center_y2, center_x1:center_x2]
+        if gray is not None:
+            gray = gray[center_y1:center_y2, center_x1:center_x2]
+        else:
+            # Convert only the crop, then resize the single-channel image
+            center_region = frame[center_y1:center_y2, center_x1:center_x2]
+            gray = cv2.cvtColor(center_region, cv2.COLOR_BGR2GRAY)
+        
+        scale = self.config.obstacle_scan_scale
+        if scale < 1.0:
+            gray = cv2.resize(
+                gray, None, fx=scale, fy=scale,
+                interpolation=cv2.INTER_AREA,
+            )
         
-        # Convert to grayscale and detect edges
-        gray = cv2.cvtColor(center_region, cv2.COLOR_BGR2GRAY)
         edges = cv2.Canny(gray, 50, 150)
         
-        # Calculate edge density
-        edge_density = np.sum(edges > 0) / edges.size
+        # Calculate edge density. Edge pixels scale with contour length
+        # but the area with its square, so rescale to the full-res density.
+        edge_density = cv2.countNonZero(edges) / edges.size * min(scale, 1.0)
         
         if edge_density > self.config.obstacle_threshold:
             return True, "center"
@@ -378,8 +526,13 @@ class SafetyModule(LoggerMixin):
         if self._pose is None:
             return False, 0.0, None
         
-        # Convert to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Downscale, then convert to RGB for MediaPipe. Process() copies
+        # its input, so both buffers can be overwritten on the next frame.
+        small = cv2.resize(
+            frame, POSE_INPUT_SIZE, dst=self._pose_small,
+            interpolation=cv2.INTER_AREA,
+        )
+        rgb_frame = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._pose_rgb)
         results = self._pose.process(rgb_frame)
         
         if results.pose_landmarks is None:
@@ -387,49 +540,40 @@ class SafetyModule(LoggerMixin):
         
         landmarks = results.pose_landmarks.landmark
         
-        # Get relevant landmarks
-        left_wrist = landmarks[self._mp_pose.PoseLandmark.LEFT_WRIST]
-        right_wrist = landmarks[self._mp_pose.PoseLandmark.RIGHT_WRIST]
-        left_shoulder = landmarks[self._mp_pose.PoseLandmark.LEFT_SHOULDER]
-        right_shoulder = landmarks[self._mp_pose.PoseLandmark.RIGHT_SHOULDER]
-        left_elbow = landmarks[self._mp_pose.PoseLandmark.LEFT_ELBOW]
-        right_elbow = landmarks[self._mp_pose.PoseLandmark.RIGHT_ELBOW]
-        
-        # Check visibility
+        # One read per landmark into rows of (x, y, visibility), ordered
+        # wrists, shoulders, elbows with left before right
+        points = np.array([
+            (landmarks[i].x, landmarks[i].y, landmarks[i].visibility)
+            for i in self._landmark_ids
+        ])
+        x, y, visibility = points.T
+        wrists_x, shoulders_x = x[0:2], x[2:4]
+        wrists_y, shoulders_y, elbows_y = y[0:2], y[2:4], y[4:6]
+        
+        # Check visibility of wrists and shoulders
         min_visibility = 0.5
-        if (
-            left_wrist.visibility < min_visibility
-            or right_wrist.visibility < min_visibility
-            or left_shoulder.visibility < min_visibility
-            or right_shoulder.visibility < min_visibility
-        ):
+        if (visibility[:4] < min_visibility).any():
             return False, 0.0, results.pose_landmarks
         
         # Calculate body center X
-        body_center_x = (left_shoulder.x + right_shoulder.x) / 2
+        body_center_x = shoulders_x.mean()
         
         # Check if arms are crossed:
         # Left wrist to the right of center, right wrist to the left
         arms_crossed_x = (
-            left_wrist.x > body_center_x 
-            and right_wrist.x < body_center_x
+            wrists_x[0] > body_center_x 
+            and wrists_x[1] < body_center_x
         )
         
         # Check if wrists are approximately at chest level
-        shoulder_y = (left_shoulder.y + right_shoulder.y) / 2
-        wrist_y_avg = (left_wrist.y + right_wrist.y) / 2
+        shoulder_y = shoulders_y.mean()
+        wrist_y_avg = wrists_y.mean()
         
         # Wrists should be below shoulders but not too far down
-        wrists_at_chest = (
-            wrist_y_avg > shoulder_y 
-            and wrist_y_avg < shoulder_y + 0.3
-        )
+        wrists_at_chest = shoulder_y < wrist_y_avg < shoulder_y + 0.3
         
         # Check if elbows are raised (arms forming X shape)
-        elbows_raised = (
-            left_elbow.y < left_wrist.y
-            and right_elbow.y < right_wrist.y
-        )
+        elbows_raised = (elbows_y < wrists_y).all()
         
         # Calculate confidence based on criteria
         confidence = 0.0
@@ -441,11 +585,7 @@ class SafetyModule(LoggerMixin):
             confidence += 0.3
         
         # Adjust by landmark visibility
-        avg_visibility = (
-            left_wrist.visibility + right_wrist.visibility
-            + left_shoulder.visibility + right_shoulder.visibility
-        ) / 4
-        confidence *= avg_visibility
+        confidence *= float(visibility[:4].mean())
         
         is_gesture = confidence >= self.config.gesture_confidence_threshold
         
@@ -4,13 +4,19 @@ State Machine for Drone Photography System.
 Orchestrates the mission flow through defined states.
 """
 
+import asyncio
 import time
-from enum import Enum, auto
-from typing import Optional, Callable, Dict, Any
+from collections import deque
+from enum import IntEnum, auto
+from threading import Event, Lock, Thread
+from typing import Optional, Callable, Dict, Any, Awaitable, Tuple
 from dataclasses import dataclass, field
+from operator import attrgetter
 
 from .utils.logger import get_logger, LoggerMixin, LogBlock
 from .utils.storage import StorageManager
+from .utils.frame_buffer import LatestFrame
+from .utils.executor import get_global_executor
 from .config import ConfigManager, Waypoint
 from .modules.flight_navigator import FlightNavigator, NavigationState
 from .modules.qr_detector import QRDetector
@@ -18,9 +24,14 @@ from .modules.photo_capture import PhotoCapture
 from .modules.safety import SafetyModule
 
 
-class MissionState(Enum):
-    """States in the mission state machine."""
-    IDLE = auto()
+class MissionState(IntEnum):
+    """
+    States in the mission state machine.
+    
+    Values are contiguous from 0 so handler tables can be lists indexed
+    by state.
+    """
+    IDLE = 0
     INITIALIZING = auto()
     TAKEOFF = auto()
     NAVIGATING = auto()
@@ -33,6 +44,26 @@ class MissionState(Enum):
     COMPLETE = auto()
     EMERGENCY = auto()
     ERROR = auto()
+    
+    def __str__(self) -> str:
+        # Readable in logs instead of IntEnum's bare number
+        return self.name
+
+
+# CaptureResult.success, read in C when counting photos
+_SUCCESS = attrgetter("success")
+
+# Most recent errors kept in MissionContext
+MAX_CONTEXT_ERRORS = 64
+
+# Tello video frame period (30 fps); paces polling of djitellopy's reader
+VIDEO_FRAME_PERIOD_SEC = 1 / 30
+
+# Precedence when a handler result and requested transitions compete
+_TRANSITION_PRIORITY = {
+    MissionState.EMERGENCY: 2,
+    MissionState.ERROR: 1,
+}
 
 
 @dataclass
@@ -42,9 +73,22 @@ class MissionContext:
     current_structure_id: str = ""
     photos_captured: int = 0
     waypoints_visited: int = 0
-    errors: list = field(default_factory=list)
-    start_time: float = 0.0
+    errors: deque = field(default_factory=lambda: deque(maxlen=MAX_CONTEXT_ERRORS))
+    start_time: float = 0.0  # Wall clock, for display
     end_time: float = 0.0
+    # Monotonic timestamps for the duration, immune to clock adjustments
+    monotonic_start: float = 0.0
+    monotonic_end: float = 0.0
+    
+    @property
+    def duration_sec(self) -> float:
+        """Mission duration in seconds."""
+        return self.monotonic_end - self.monotonic_start
+    
+    def mark_end(self) -> None:
+        """Record the mission end time."""
+        self.end_time = time.time()
+        self.monotonic_end = time.monotonic()
 
 
 class MissionStateMachine(LoggerMixin):
@@ -63,9 +107,12 @@ class MissionStateMachine(LoggerMixin):
         config = load_config()
         machine = MissionStateMachine(config, tello)
         
-        # Run synchronously
+        # Run to completion (drives run_async on an event loop)
         machine.run()
         
+        # Or inside an existing event loop
+        await machine.run_async()
+        
         # Or step through manually
         machine.start()
         while not machine.is_complete():
@@ -93,6 +140,13 @@ class MissionStateMachine(LoggerMixin):
         self._state = MissionState.IDLE
         self._context = MissionContext()
         self._running = False
+        # Wakes the run loop early on stop or emergency
+        self._wake_event = Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_wake: Optional[asyncio.Event] = None
+        # Transitions requested from other threads, applied by step()
+        self._pending_transitions: deque = deque()
+        self._pending_lock = Lock()
         
         # Initialize modules (will be set up in INITIALIZING state)
         self.navigator: Optional[FlightNavigator] = None
@@ -101,22 +155,15 @@ class MissionStateMachine(LoggerMixin):
         self.safety: Optional[SafetyModule] = None
         self.storage: Optional[StorageManager] = None
         
-        # State handlers mapping
-        self._state_handlers: Dict[MissionState, Callable[[], MissionState]] = {
-            MissionState.IDLE: self._handle_idle,
-            MissionState.INITIALIZING: self._handle_initializing,
-            MissionState.TAKEOFF: self._handle_takeoff,
-            MissionState.NAVIGATING: self._handle_navigating,
-            MissionState.STOPPING: self._handle_stopping,
-            MissionState.DETECTING: self._handle_detecting,
-            MissionState.PHOTOGRAPHING: self._handle_photographing,
-            MissionState.NAVIGATING_NEXT: self._handle_navigating_next,
-            MissionState.RETURNING_HOME: self._handle_returning_home,
-            MissionState.LANDING: self._handle_landing,
-            MissionState.COMPLETE: self._handle_complete,
-            MissionState.EMERGENCY: self._handle_emergency,
-            MissionState.ERROR: self._handle_error,
-        }
+        # Background encode/write work, overlapped with drone motion
+        self._io_pool = get_global_executor()
+        
+        # Newest video frame, fed by the frame pump thread from the drone's
+        # frame reader (acquired once in INITIALIZING)
+        self._frame_reader = None
+        self._frames = LatestFrame()
+        self._pump_thread: Optional[Thread] = None
+        self._pump_stop = Event()
         
         self.logger.info("MissionStateMachine initialized")
     
@@ -137,7 +184,9 @@ class MissionStateMachine(LoggerMixin):
             return
         
         self._running = True
-        self._context = MissionContext(start_time=time.time())
+        self._context = MissionContext(
+            start_time=time.time(), monotonic_start=time.monotonic()
+        )
         self._transition_to(MissionState.INITIALIZING)
         
         self.logger.info("Mission started")
@@ -145,6 +194,7 @@ class MissionStateMachine(LoggerMixin):
     def stop(self) -> None:
         """Stop the mission (graceful shutdown)."""
         self._running = False
+        self._wake()
         self.logger.info("Mission stop requested")
     
     def step(self) -> MissionState:
@@ -154,25 +204,39 @@ class MissionStateMachine(LoggerMixin):
         Returns:
             New state after step execution.
         """
-        if not self._running:
+        if not self._ready_to_step():
             return self._state
         
-        # Check for emergency before processing state
-        if self._check_emergency():
-            self._transition_to(MissionState.EMERGENCY)
+        # Execute current state handler
+        try:
+            self._finish_step(self._HANDLERS[self._state](self))
+        except Exception as e:
+            self._fail_step(e)
+        
+        return self._state
+    
+    async def step_async(self) -> MissionState:
+        """
+        Execute one step of the state machine without blocking the loop.
+        
+        States that wait on the drone (navigation, hover, QR detection,
+        photos) await their coroutine handlers; the rest run inline.
+        
+        Returns:
+            New state after step execution.
+        """
+        if not self._ready_to_step():
             return self._state
         
-        # Execute current state handler
-        handler = self._state_handlers.get(self._state)
-        if handler:
-            try:
-                next_state = handler()
-                if next_state != self._state:
-                    self._transition_to(next_state)
-            except Exception as e:
-                self.logger.error(f"State handler error: {e}")
-                self._context.errors.append(str(e))
-                self._transition_to(MissionState.ERROR)
+        async_handler = self._ASYNC_HANDLERS[self._state]
+        try:
+            if async_handler is not None:
+                next_state = await async_handler(self)
+            else:
+                next_state = self._HANDLERS[self._state](self)
+            self._finish_step(next_state)
+        except Exception as e:
+            self._fail_step(e)
         
         return self._state
     
@@ -183,11 +247,31 @@ class MissionStateMachine(LoggerMixin):
         Returns:
             MissionContext with results.
         """
+        return asyncio.run(self.run_async())
+    
+    async def run_async(self) -> MissionContext:
+        """
+        Run the complete mission on the current event loop.
+        
+        Returns:
+            MissionContext with results.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._async_wake = asyncio.Event()
         self.start()
         
-        while self._running and not self.is_complete():
-            self.step()
-            time.sleep(0.1)  # Small delay between steps
+        try:
+            while self._running and not self.is_complete():
+                await self.step_async()
+                # Small delay between steps, cut short by stop or emergency
+                try:
+                    await asyncio.wait_for(self._async_wake.wait(), 0.1)
+                except asyncio.TimeoutError:
+                    pass
+                self._async_wake.clear()
+        finally:
+            self._loop = None
+            self._async_wake = None
         
         return self._context
     
@@ -199,15 +283,97 @@ class MissionStateMachine(LoggerMixin):
         )
     
     def trigger_emergency(self) -> None:
-        """Manually trigger emergency."""
+        """
+        Manually trigger emergency.
+        
+        Safe to call from any thread. The transition is queued and applied
+        by the stepping thread, so it can't be overwritten by the result
+        of a handler that is still running.
+        """
         self.logger.warning("Manual emergency triggered")
-        self._transition_to(MissionState.EMERGENCY)
+        self._request_transition(MissionState.EMERGENCY)
+        self._wake()
+    
+    def _request_transition(self, new_state: MissionState) -> None:
+        """Queue a transition for the next step."""
+        with self._pending_lock:
+            self._pending_transitions.append(new_state)
+    
+    def _take_pending(self) -> Optional[MissionState]:
+        """Drain queued transitions, returning the highest priority one."""
+        with self._pending_lock:
+            if not self._pending_transitions:
+                return None
+            pending = max(
+                self._pending_transitions,
+                key=lambda state: _TRANSITION_PRIORITY.get(state, 0),
+            )
+            self._pending_transitions.clear()
+        
+        # Already handled (or past the point where it matters)
+        if pending == MissionState.EMERGENCY and self._state in (
+            MissionState.EMERGENCY, MissionState.ERROR, MissionState.COMPLETE,
+        ):
+            return None
+        return pending
+    
+    def _resolve_transition(
+        self,
+        next_state: MissionState,
+        pending: Optional[MissionState],
+    ) -> MissionState:
+        """Pick between a handler result and a queued transition."""
+        if pending is None:
+            return next_state
+        if _TRANSITION_PRIORITY.get(pending, 0) >= _TRANSITION_PRIORITY.get(next_state, 0):
+            return pending
+        return next_state
+    
+    def _wake(self) -> None:
+        """Wake the run loop; safe to call from any thread."""
+        self._wake_event.set()
+        loop, wake = self._loop, self._async_wake
+        if loop is not None and wake is not None:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                # Loop already closed
+                pass
+    
+    def _ready_to_step(self) -> bool:
+        """Check the mission is running and no emergency is pending."""
+        if not self._running:
+            return False
+        
+        # Apply requested transitions before processing state
+        pending = self._take_pending()
+        if pending is not None:
+            self._transition_to(pending)
+            return False
+        
+        # Check for emergency before processing state
+        if self._check_emergency():
+            self._transition_to(MissionState.EMERGENCY)
+            return False
+        return True
+    
+    def _finish_step(self, next_state: MissionState) -> None:
+        """Apply the state returned by a handler, unless overridden."""
+        next_state = self._resolve_transition(next_state, self._take_pending())
+        if next_state != self._state:
+            self._transition_to(next_state)
+    
+    def _fail_step(self, error: Exception) -> None:
+        """Record a handler exception and move to ERROR."""
+        self.logger.error("State handler error: %s", error)
+        self._context.errors.append(str(error))
+        self._finish_step(MissionState.ERROR)
     
     def _transition_to(self, new_state: MissionState) -> None:
         """Transition to a new state."""
         old_state = self._state
         self._state = new_state
-        self.logger.info(f"State: {old_state.name} -> {new_state.name}")
+        self.logger.info("State: %s -> %s", old_state.name, new_state.name)
     
     def _check_emergency(self) -> bool:
         """Check if emergency should be triggered."""
@@ -216,13 +382,47 @@ class MissionStateMachine(LoggerMixin):
         return self.safety.is_emergency_triggered()
     
     def _get_frame(self):
-        """Get frame from drone or None if not available."""
-        if self.tello is not None:
-            try:
-                return self.tello.get_frame_read().frame
-            except Exception:
-                pass
-        return None
+        """Get the newest frame from drone or None if not available."""
+        return self._frames.get()
+    
+    def _start_frame_pump(self) -> None:
+        """Start publishing drone frames to the latest-frame buffer."""
+        if self._frame_reader is None:
+            return
+        
+        self._pump_stop.clear()
+        self._pump_thread = Thread(
+            target=self._frame_pump_loop, args=(self._frame_reader,), daemon=True
+        )
+        self._pump_thread.start()
+    
+    def _stop_frame_pump(self) -> None:
+        """Stop the frame pump thread."""
+        self._pump_stop.set()
+        if self._pump_thread is not None:
+            self._pump_thread.join(timeout=1.0)
+            self._pump_thread = None
+    
+    def _frame_pump_loop(self, frame_read) -> None:
+        """
+        Publish each new frame decoded by djitellopy.
+        
+        The reader has no new-frame callback, so the loop polls it paced
+        to the video frame period: after a new frame it sleeps most of a
+        period, then checks a few times a period until the next arrives.
+        """
+        last_frame = None
+        
+        while not self._pump_stop.is_set():
+            # djitellopy assigns a new array per decoded frame
+            frame = frame_read.frame
+            if frame is not None and frame is not last_frame:
+                self._frames.put(frame)
+                last_frame = frame
+                delay = VIDEO_FRAME_PERIOD_SEC * 0.75
+            else:
+                delay = VIDEO_FRAME_PERIOD_SEC / 4
+            self._pump_stop.wait(delay)
     
     # State handlers
     
@@ -253,10 +453,12 @@ class MissionStateMachine(LoggerMixin):
             # QR Detector
             try:
                 self.qr_detector = QRDetector(
-                    fallback_id=self.config.mission.detection.fallback_id
+                    fallback_id=self.config.mission.detection.fallback_id,
+                    use_pyzbar=self.config.mission.detection.use_pyzbar,
+                    scan_scale=self.config.mission.detection.scan_scale,
                 )
             except ImportError as e:
-                self.logger.warning(f"QR detector not available: {e}")
+                self.logger.warning("QR detector not available: %s", e)
                 self.qr_detector = None
             
             # Photo Capture
@@ -268,18 +470,36 @@ class MissionStateMachine(LoggerMixin):
             # Wire up rotation function
             if self.navigator:
                 self.photo_capture.set_rotation_function(self.navigator.rotate)
+            self.photo_capture.set_io_executor(self._io_pool)
+            
+            if self.tello is not None:
+                try:
+                    self._frame_reader = self.tello.get_frame_read()
+                except Exception as e:
+                    self.logger.warning("Video stream not available: %s", e)
+            
+            if self._frame_reader is not None:
+                self.photo_capture.set_frame_buffer(self._frames)
             
             # Safety Module
             try:
                 self.safety = SafetyModule(self.config.mission.safety)
                 self.safety.set_emergency_callback(self.trigger_emergency)
-                
-                # Start safety monitoring if we have a frame source
-                if self.tello is not None:
-                    self.safety.start_monitoring(self._get_frame)
             except ImportError as e:
-                self.logger.warning(f"Safety module not available: {e}")
+                self.logger.warning("Safety module not available: %s", e)
                 self.safety = None
+            
+            # Frame consumers wake on each new frame
+            if self.qr_detector is not None:
+                self._frames.add_listener(self.qr_detector.notify_new_frame)
+            if self.safety is not None:
+                self._frames.add_listener(self.safety.notify_new_frame)
+            
+            # Start safety monitoring if we have a frame source
+            if self.tello is not None:
+                self._start_frame_pump()
+                if self.safety is not None:
+                    self.safety.start_monitoring(self._get_frame)
         
         return MissionState.TAKEOFF
     
@@ -295,7 +515,15 @@ class MissionStateMachine(LoggerMixin):
     def _handle_navigating(self) -> MissionState:
         """Handle NAVIGATING state - moving to waypoint."""
         result = self.navigator.navigate_to_next()
-        
+        return self._navigation_outcome(result)
+    
+    async def _handle_navigating_async(self) -> MissionState:
+        """Async version of _handle_navigating."""
+        result = await self.navigator.navigate_to_next_async()
+        return self._navigation_outcome(result)
+    
+    def _navigation_outcome(self, result) -> MissionState:
+        """Update the context from a navigation result."""
         if result.success:
             self._context.current_stop_number += 1
             self._context.waypoints_visited += 1
@@ -310,6 +538,11 @@ class MissionStateMachine(LoggerMixin):
         time.sleep(self.config.mission.flight.hover_stability_delay_sec)
         return MissionState.DETECTING
     
+    async def _handle_stopping_async(self) -> MissionState:
+        """Async version of _handle_stopping."""
+        await asyncio.sleep(self.config.mission.flight.hover_stability_delay_sec)
+        return MissionState.DETECTING
+    
     def _handle_detecting(self) -> MissionState:
         """Handle DETECTING state - detecting QR code."""
         if self.qr_detector is None:
@@ -325,41 +558,77 @@ class MissionStateMachine(LoggerMixin):
             timeout_sec=self.config.mission.detection.qr_timeout_sec
         )
         
+        return self._detection_outcome(structure_id)
+    
+    async def _handle_detecting_async(self) -> MissionState:
+        """Async version of _handle_detecting."""
+        if self.qr_detector is None:
+            return self._handle_detecting()
+        
+        self.qr_detector.start_detection(self._get_frame)
+        
+        # Wait in the loop's default executor so the loop keeps serving
+        # stop/emergency; the shared pool is kept for short jobs like encodes
+        loop = asyncio.get_running_loop()
+        structure_id = await loop.run_in_executor(
+            None,
+            self.qr_detector.wait_for_detection,
+            self.config.mission.detection.qr_timeout_sec,
+        )
+        
+        return self._detection_outcome(structure_id)
+    
+    def _detection_outcome(self, structure_id: str) -> MissionState:
+        """Stop detection and record the structure ID."""
         self.qr_detector.stop_detection()
         
         self._context.current_structure_id = structure_id
-        self.logger.info(f"Detected structure: {structure_id}")
+        self.logger.info("Detected structure: %s", structure_id)
         
         return MissionState.PHOTOGRAPHING
     
     def _handle_photographing(self) -> MissionState:
         """Handle PHOTOGRAPHING state - capturing photos."""
         with LogBlock("Photo capture", self.logger):
-            # Determine frame source
-            if self.simulate:
-                # Use placeholder frame generator
-                frame_source = lambda: None
-            else:
-                frame_source = self._get_frame
-            
             # Capture all angles
             results = self.photo_capture.capture_all_angles(
-                frame_source=frame_source,
+                frame_source=self._photo_frame_source(),
                 structure_id=self._context.current_structure_id,
                 stop_number=self._context.current_stop_number,
             )
-            
-            # Count successful captures
-            successful = sum(1 for r in results if r.success)
-            self._context.photos_captured += successful
-            
-            self.logger.info(
-                f"Captured {successful}/{len(results)} photos at stop "
-                f"{self._context.current_stop_number}"
+            self._record_captures(results)
+        
+        return MissionState.NAVIGATING_NEXT
+    
+    async def _handle_photographing_async(self) -> MissionState:
+        """Async version of _handle_photographing."""
+        with LogBlock("Photo capture", self.logger):
+            results = await self.photo_capture.capture_all_angles_async(
+                frame_source=self._photo_frame_source(),
+                structure_id=self._context.current_structure_id,
+                stop_number=self._context.current_stop_number,
             )
+            self._record_captures(results)
         
         return MissionState.NAVIGATING_NEXT
     
+    def _photo_frame_source(self) -> Callable[[], Any]:
+        """Determine the frame source for photo capture."""
+        if self.simulate:
+            # Use placeholder frame generator
+            return lambda: None
+        return self._get_frame
+    
+    def _record_captures(self, results) -> None:
+        """Count successful captures at the current stop."""
+        successful = sum(map(_SUCCESS, results))
+        self._context.photos_captured += successful
+        
+        self.logger.info(
+            "Captured %d/%d photos at stop %d",
+            successful, len(results), self._context.current_stop_number,
+        )
+    
     def _handle_navigating_next(self) -> MissionState:
         """Handle NAVIGATING_NEXT state - decide next action."""
         if self.navigator.has_more_waypoints():
@@ -386,11 +655,12 @@ class MissionStateMachine(LoggerMixin):
             # Stop safety monitoring
             if self.safety:
                 self.safety.stop_monitoring()
+            self._stop_frame_pump()
             
             # Land
             self.navigator.land()
             
-            self._context.end_time = time.time()
+            self._context.mark_end()
         
         # Check if we came from error/emergency
         if self._context.errors:
@@ -402,13 +672,13 @@ class MissionStateMachine(LoggerMixin):
         """Handle COMPLETE state - mission finished successfully."""
         self._running = False
         
-        duration = self._context.end_time - self._context.start_time
+        duration = self._context.duration_sec
         
         self.logger.info("=" * 50)
         self.logger.info("MISSION COMPLETE")
-        self.logger.info(f"  Duration: {duration:.1f} seconds")
-        self.logger.info(f"  Waypoints visited: {self._context.waypoints_visited}")
-        self.logger.info(f"  Photos captured: {self._context.photos_captured}")
+        self.logger.info("  Duration: %.1f seconds", duration)
+        self.logger.info("  Waypoints visited: %d", self._context.waypoints_visited)
+        self.logger.info("  Photos captured: %d", self._context.photos_captured)
         self.logger.info("=" * 50)
         
         return MissionState.COMPLETE
@@ -422,13 +692,14 @@ class MissionStateMachine(LoggerMixin):
             self.safety.stop_monitoring()
         if self.qr_detector:
             self.qr_detector.stop_detection()
+        self._stop_frame_pump()
         
         # Emergency land
         if self.navigator:
             self.navigator.emergency_land()
         
         self._context.errors.append("Emergency landing triggered")
-        self._context.end_time = time.time()
+        self._context.mark_end()
         
         return MissionState.ERROR
     
@@ -438,7 +709,43 @@ class MissionStateMachine(LoggerMixin):
         
         self.logger.error("=" * 50)
         self.logger.error("MISSION FAILED")
-        self.logger.error(f"  Errors: {self._context.errors}")
+        self.logger.error("  Errors: %s", list(self._context.errors))
         self.logger.error("=" * 50)
         
         return MissionState.ERROR
+    
+    # Dispatch tables shared by all instances, indexed by state. Every
+    # state must have a handler; building the tuple raises KeyError
+    # otherwise. (map, not a comprehension, so the class scope is visible.)
+    _handler_map: Dict[MissionState, Callable[..., MissionState]] = {
+        MissionState.IDLE: _handle_idle,
+        MissionState.INITIALIZING: _handle_initializing,
+        MissionState.TAKEOFF: _handle_takeoff,
+        MissionState.NAVIGATING: _handle_navigating,
+        MissionState.STOPPING: _handle_stopping,
+        MissionState.DETECTING: _handle_detecting,
+        MissionState.PHOTOGRAPHING: _handle_photographing,
+        MissionState.NAVIGATING_NEXT: _handle_navigating_next,
+        MissionState.RETURNING_HOME: _handle_returning_home,
+        MissionState.LANDING: _handle_landing,
+        MissionState.COMPLETE: _handle_complete,
+        MissionState.EMERGENCY: _handle_emergency,
+        MissionState.ERROR: _handle_error,
+    }
+    _HANDLERS: Tuple[Callable[..., MissionState], ...] = tuple(
+        map(_handler_map.__getitem__, MissionState)
+    )
+    
+    # Coroutine versions of handlers that wait on the drone, used by
+    # step_async so those waits don't block the event loop
+    _async_handler_map: Dict[MissionState, Callable[..., Awaitable[MissionState]]] = {
+        MissionState.NAVIGATING: _handle_navigating_async,
+        MissionState.STOPPING: _handle_stopping_async,
+        MissionState.DETECTING: _handle_detecting_async,
+        MissionState.PHOTOGRAPHING: _handle_photographing_async,
+    }
+    _ASYNC_HANDLERS: Tuple[Optional[Callable[..., Awaitable[MissionState]]], ...] = tuple(
+        map(_async_handler_map.get, MissionState)
+    )
+    
+    del _handler_map, _async_handler_map
@@ -4,9 +4,19 @@ Utility modules for drone photography system.
 Utilities:
 - logger: Logging configuration and utilities
 - storage: Photo storage management
+- frame_buffer: Latest-frame handoff between camera and consumers
+- executor: Shared thread pool for background jobs
 """
 
 from .logger import setup_logger, get_logger
 from .storage import StorageManager
+from .frame_buffer import LatestFrame
+from .executor import get_global_executor
 
-__all__ = ["setup_logger", "get_logger", "StorageManager"]
+__all__ = [
+    "setup_logger",
+    "get_logger",
+    "StorageManager",
+    "LatestFrame",
+    "get_global_executor",
+]
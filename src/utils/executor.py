@@ -0,0 +1,38 @@
+"""
+Shared Thread Pool for Drone Photography System.
+
+One process-wide pool for short background jobs (JPEG encoding, photo
+writes), so each subsystem doesn't start and keep its own worker threads.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Optional
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+
+
+def get_global_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool, creating it on first use.
+    
+    Long-running loops (safety monitoring, QR detection, the frame pump)
+    keep their own threads, and long blocking waits belong in the event
+    loop's default executor; only submit jobs that finish quickly, so
+    they never wait behind a blocked worker.
+    
+    Returns:
+        Process-wide ThreadPoolExecutor.
+    """
+    global _executor
+    
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=min(4, os.cpu_count() or 2),
+                    thread_name_prefix="drone",
+                )
+    return _executor
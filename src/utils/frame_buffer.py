@@ -0,0 +1,98 @@
+"""
+Latest-Frame Buffer for Drone Photography System.
+
+Hands the newest camera frame from the video thread to the detection,
+safety and capture consumers without queueing stale frames.
+"""
+
+from threading import Condition
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+# Annotations only; importing src.utils must not load numpy
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class LatestFrame:
+    """
+    Single-slot LIFO frame buffer.
+    
+    The producer replaces the slot on every frame and never blocks on
+    consumers; consumers always read the newest frame. Frames are passed by
+    reference, so the producer must hand over a new array per frame (as
+    djitellopy's frame reader does) rather than refilling one in place.
+    
+    Usage:
+        frames = LatestFrame()
+        frames.add_listener(detector.notify_new_frame)
+        
+        # Camera thread
+        frames.put(frame)
+        
+        # Consumers
+        detector.start_detection(frames.get)
+    """
+    
+    __slots__ = ("_lock", "_frame", "_sequence", "_listeners")
+    
+    def __init__(self):
+        # Condition so wait_newer can block until put() runs
+        self._lock = Condition()
+        self._frame: "Optional[np.ndarray]" = None
+        self._sequence = 0
+        self._listeners: List[Callable[[], None]] = []
+    
+    def put(self, frame: "np.ndarray") -> None:
+        """
+        Publish a new frame and notify listeners.
+        
+        Args:
+            frame: Newest camera frame.
+        """
+        with self._lock:
+            self._frame = frame
+            self._sequence += 1
+            self._lock.notify_all()
+        
+        for listener in self._listeners:
+            listener()
+    
+    def get(self) -> "Optional[np.ndarray]":
+        """Get the newest frame, or None if none has arrived yet."""
+        return self._frame
+    
+    @property
+    def sequence(self) -> int:
+        """Number of frames published so far."""
+        return self._sequence
+    
+    def wait_newer(self, sequence: int, timeout: float) -> bool:
+        """
+        Wait until a frame after the given sequence number is published.
+        
+        Args:
+            sequence: Sequence number to wait past (see sequence).
+            timeout: Maximum time to wait in seconds.
+            
+        Returns:
+            True if a newer frame arrived, False on timeout.
+        """
+        with self._lock:
+            return self._lock.wait_for(lambda: self._sequence > sequence, timeout)
+    
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Register a callback run on every new frame.
+        
+        Listeners run on the producer thread and must not block.
+        
+        Args:
+            listener: Callable taking no arguments.
+        """
+        self._listeners = self._listeners + [listener]
+    
+    def clear(self) -> None:
+        """Drop the stored frame and all listeners."""
+        with self._lock:
+            self._frame = None
+        self._listeners = []
@@ -5,23 +5,31 @@ Provides consistent logging across all modules with both
 file and console output.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-# Module-level logger registry
-_loggers: dict = {}
-_initialized: bool = False
+# Not recoverable from the handler, which only knows the opened file
 _log_file_path: Optional[Path] = None
 
+# Background thread writing the log file, replaced on each setup
+_file_listener: Optional[logging.handlers.QueueListener] = None
+
+# Application root logger; configured once it has handlers
+ROOT_LOGGER_NAME = "drone_photo"
+
 
 def setup_logger(
     level: str = "INFO",
     log_file: Optional[str] = None,
     console: bool = True,
-    name: str = "drone_photo",
+    name: str = ROOT_LOGGER_NAME,
 ) -> logging.Logger:
     """
     Set up the root logger for the application.
@@ -35,7 +43,7 @@ def setup_logger(
     Returns:
         Configured logger instance.
     """
-    global _initialized, _log_file_path
+    global _log_file_path, _file_listener
     
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
@@ -46,6 +54,7 @@ def setup_logger(
     
     # Clear any existing handlers
     logger.handlers.clear()
+    _stop_file_listener()
     
     # Create formatter
     formatter = logging.Formatter(
@@ -72,19 +81,45 @@ def setup_logger(
         file_handler = logging.FileHandler(log_file_with_timestamp, encoding='utf-8')
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # Callers only enqueue records; a listener thread does the writes
+        # so a slow SD card doesn't stall the mission loop
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _file_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _file_listener.start()
         
         _log_file_path = log_file_with_timestamp
     
-    _initialized = True
-    _loggers[name] = logger
+    if not logger.handlers:
+        # Silent, but still marks the logger as configured
+        logger.addHandler(logging.NullHandler())
     
-    logger.info(f"Logger initialized - Level: {level}, Console: {console}, File: {log_file}")
+    logger.info(
+        "Logger initialized - Level: %s, Console: %s, File: %s",
+        level, console, log_file,
+    )
     
     return logger
 
 
-def get_logger(name: str = "drone_photo") -> logging.Logger:
+def _stop_file_listener() -> None:
+    """Flush queued records to the log file and close it."""
+    global _file_listener
+    
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
+
+def get_logger(name: str = ROOT_LOGGER_NAME) -> logging.Logger:
     """
     Get a logger instance.
     
@@ -97,15 +132,16 @@ def get_logger(name: str = "drone_photo") -> logging.Logger:
     Returns:
         Logger instance.
     """
-    global _initialized
-    
-    if not _initialized:
+    # logging's manager already caches loggers; only check the root
+    # logger's own handlers, since inherited ones (pytest, basicConfig)
+    # wouldn't set our level or format
+    if not logging.getLogger(ROOT_LOGGER_NAME).handlers:
         # Create a basic logger if setup hasn't been called
         setup_logger()
     
     # For child loggers, get as child of root
-    if name != "drone_photo" and not name.startswith("drone_photo."):
-        name = f"drone_photo.{name}"
+    if name != ROOT_LOGGER_NAME and not name.startswith(ROOT_LOGGER_NAME + "."):
+        name = f"{ROOT_LOGGER_NAME}.{name}"
     
     return logging.getLogger(name)
 
@@ -120,6 +156,21 @@ def get_log_file_path() -> Optional[Path]:
     return _log_file_path
 
 
+class _ClassLogger:
+    """
+    Class-level logger slot resolved on first access.
+    
+    Replaces itself on the class with the logger, so later lookups are a
+    plain class attribute read. Resolving lazily (not at class creation)
+    keeps imports from configuring logging.
+    """
+    
+    def __get__(self, obj, owner) -> logging.Logger:
+        logger = get_logger(owner.__name__)
+        setattr(owner, "logger", logger)
+        return logger
+
+
 class LoggerMixin:
     """
     Mixin class that provides a logger attribute to any class.
@@ -130,12 +181,12 @@ class LoggerMixin:
                 self.logger.info("Doing something...")
     """
     
-    @property
-    def logger(self) -> logging.Logger:
-        """Get logger for this class."""
-        if not hasattr(self, '_logger'):
-            self._logger = get_logger(self.__class__.__name__)
-        return self._logger
+    logger = _ClassLogger()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Own slot per subclass, so it never inherits its parent's logger
+        cls.logger = _ClassLogger()
 
 
 # Convenience context manager for logging blocks
@@ -154,18 +205,19 @@ class LogBlock:
         self.start_time = None
     
     def __enter__(self):
-        self.start_time = datetime.now()
-        self.logger.info(f"▶ Starting: {self.description}")
+        self.start_time = time.perf_counter()
+        self.logger.info("▶ Starting: %s", self.description)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = (datetime.now() - self.start_time).total_seconds()
+        duration = time.perf_counter() - self.start_time
         
         if exc_type is not None:
             self.logger.error(
-                f"✖ Failed: {self.description} after {duration:.2f}s - {exc_type.__name__}: {exc_val}"
+                "✖ Failed: %s after %.2fs - %s: %s",
+                self.description, duration, exc_type.__name__, exc_val,
             )
         else:
-            self.logger.info(f"✔ Completed: {self.description} in {duration:.2f}s")
+            self.logger.info("✔ Completed: %s in %.2fs", self.description, duration)
         
         return False  # Don't suppress exceptions
@@ -5,12 +5,45 @@ Handles organized storage of captured photos with consistent
 naming conventions and directory structure.
 """
 
+import logging
 import os
+import re
+from concurrent.futures import Future, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from threading import Lock
+from typing import Dict, Optional, List, Set, Tuple, Union
 
 from .logger import get_logger
+from .executor import get_global_executor
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+# Shared libjpeg-turbo encoder, created on first use
+_turbojpeg = None
+
+# Characters not allowed in file/directory names, mapped to '_'
+_FILENAME_TRANSLATION = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+# Session directory names (YYYY-MM-DD); ASCII digits only
+_DATE_DIR_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+
+def _get_turbojpeg():
+    """Get the shared TurboJPEG encoder, or None if unavailable."""
+    global _turbojpeg, TURBOJPEG_AVAILABLE
+    
+    if _turbojpeg is None and TURBOJPEG_AVAILABLE:
+        try:
+            _turbojpeg = TurboJPEG()
+        except (OSError, RuntimeError):
+            # Python bindings installed but libturbojpeg missing
+            TURBOJPEG_AVAILABLE = False
+    return _turbojpeg
 
 
 class StorageManager:
@@ -42,6 +75,19 @@ class StorageManager:
         # Track current session
         self._session_date = datetime.now().strftime("%Y-%m-%d")
         self._captured_photos: List[Path] = []
+        
+        # Photo directories created this session, by sanitized structure
+        # ID; the lock covers first creation when save_frame_async runs on
+        # pool threads
+        self._session_root = self.output_directory / self._session_date
+        self._photo_dirs: Dict[str, Path] = {}
+        self._dirs_lock = Lock()
+        
+        # Saves submitted by save_frame_async that haven't finished
+        self._pending_saves: Set[Future] = set()
+        
+        # OpenCV imencode parameters per JPEG quality; one entry in practice
+        self._encode_params: Dict[int, Tuple[int, int]] = {}
     
     def get_photo_path(
         self,
@@ -69,9 +115,15 @@ class StorageManager:
         if structure_id.upper() == "UNKNOWN":
             safe_structure_id = f"UNKNOWN_STOP{stop_number}"
         
-        # Build path
-        photo_dir = self.output_directory / self._session_date / safe_structure_id
-        photo_dir.mkdir(parents=True, exist_ok=True)
+        # Build path; directories are joined and created once per structure
+        photo_dir = self._photo_dirs.get(safe_structure_id)
+        if photo_dir is None:
+            with self._dirs_lock:
+                photo_dir = self._photo_dirs.get(safe_structure_id)
+                if photo_dir is None:
+                    photo_dir = self._session_root / safe_structure_id
+                    photo_dir.mkdir(parents=True, exist_ok=True)
+                    self._photo_dirs[safe_structure_id] = photo_dir
         
         filename = f"stop{stop_number}_{angle_name}.{extension}"
         return photo_dir / filename
@@ -97,11 +149,11 @@ class StorageManager:
         """
         photo_path = self.get_photo_path(structure_id, stop_number, angle_name)
         
-        with open(photo_path, 'wb') as f:
-            f.write(image_data)
+        self._write_file(photo_path, image_data)
         
         self._captured_photos.append(photo_path)
-        self.logger.info(f"Saved photo: {photo_path}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Saved photo: %s", photo_path)
         
         return photo_path
     
@@ -126,26 +178,163 @@ class StorageManager:
         Returns:
             Path where the photo was saved.
         """
-        import cv2
-        
         photo_path = self.get_photo_path(structure_id, stop_number, angle_name)
         
         # Encode and save
-        encode_params = [cv2.IMWRITE_JPEG_QUALITY, quality]
-        success, encoded = cv2.imencode('.jpg', frame, encode_params)
+        image_data = self._encode_jpeg(frame, quality)
         
-        if success:
-            with open(photo_path, 'wb') as f:
-                f.write(encoded.tobytes())
+        if image_data is not None:
+            self._write_file(photo_path, image_data)
             
             self._captured_photos.append(photo_path)
-            self.logger.info(f"Saved frame: {photo_path}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Saved frame: %s", photo_path)
         else:
             self.logger.error(f"Failed to encode frame for: {photo_path}")
             raise IOError(f"Failed to encode frame: {photo_path}")
         
         return photo_path
     
+    def save_frame_async(
+        self,
+        frame,
+        structure_id: str,
+        stop_number: int,
+        angle_name: str,
+        quality: int = 95,
+    ) -> "Future[Path]":
+        """
+        Encode and save a frame on a background thread.
+        
+        The frame is copied first, so the caller may reuse its buffer.
+        
+        Args:
+            frame: OpenCV frame (numpy array).
+            structure_id: Structure identifier from QR code.
+            stop_number: Waypoint/stop number.
+            angle_name: Name of the angle.
+            quality: JPEG quality (0-100).
+            
+        Returns:
+            Future resolving to the saved path (or raising IOError).
+        """
+        future = get_global_executor().submit(
+            self.save_frame, frame.copy(), structure_id, stop_number,
+            angle_name, quality,
+        )
+        self._pending_saves.add(future)
+        future.add_done_callback(self._pending_saves.discard)
+        return future
+    
+    def close(self) -> None:
+        """Wait for pending background saves."""
+        wait(list(self._pending_saves))
+    
+    def encode_frame(self, frame, quality: int = 95) -> memoryview:
+        """
+        Encode a cv2 frame as JPEG without writing it.
+        
+        Args:
+            frame: OpenCV frame (numpy array).
+            quality: JPEG quality (0-100).
+            
+        Returns:
+            Encoded JPEG data, viewed without copying into bytes.
+        """
+        image_data = self._encode_jpeg(frame, quality)
+        if image_data is None:
+            raise IOError("Failed to encode frame")
+        return image_data
+    
+    def save_photos_batch(
+        self,
+        photos: List[Tuple[Union[bytes, memoryview], str, int, str]],
+    ) -> List[Optional[Path]]:
+        """
+        Write several encoded photos in one pass.
+        
+        Each photo stays a separate JPEG in the documented directory
+        layout, so this is still one open/write/close per file; files are
+        written with raw os.write calls and each directory is created
+        once. A failed path or write fails only that photo.
+        
+        Args:
+            photos: (image_data, structure_id, stop_number, angle_name) tuples.
+            
+        Returns:
+            Saved path for each photo, or None where the write failed.
+        """
+        saved: List[Optional[Path]] = []
+        
+        for image_data, structure_id, stop_number, angle_name in photos:
+            try:
+                photo_path = self.get_photo_path(structure_id, stop_number, angle_name)
+                self._write_file(photo_path, image_data)
+            except OSError as e:
+                self.logger.error(
+                    "Failed to save photo %s/stop%d_%s: %s",
+                    structure_id, stop_number, angle_name, e,
+                )
+                saved.append(None)
+                continue
+            
+            self._captured_photos.append(photo_path)
+            saved.append(photo_path)
+        
+        self.logger.info(
+            "Saved %d/%d photos", sum(p is not None for p in saved), len(photos)
+        )
+        return saved
+    
+    @staticmethod
+    def _write_file(path: Path, data: Union[bytes, memoryview]) -> None:
+        """
+        Write a buffer to a file with raw os.write calls.
+        
+        Args:
+            path: Destination file, created or truncated.
+            data: Bytes-like object to write.
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
+    def _encode_jpeg(self, frame, quality: int) -> Optional[memoryview]:
+        """
+        Encode a BGR frame as JPEG.
+        
+        Uses libjpeg-turbo via PyTurboJPEG when available, otherwise
+        OpenCV. OpenCV's output array is wrapped rather than copied into
+        bytes.
+        
+        Args:
+            frame: OpenCV frame (numpy array).
+            quality: JPEG quality (0-100).
+            
+        Returns:
+            Encoded JPEG data, or None if encoding failed.
+        """
+        jpeg = _get_turbojpeg()
+        if jpeg is not None:
+            return memoryview(
+                jpeg.encode(frame, quality=quality, pixel_format=TJPF_BGR)
+            )
+        
+        import cv2
+        
+        params = self._encode_params.get(quality)
+        if params is None:
+            params = self._encode_params[quality] = (
+                cv2.IMWRITE_JPEG_QUALITY, quality,
+            )
+        
+        success, encoded = cv2.imencode('.jpg', frame, params)
+        return memoryview(encoded) if success else None
+    
     def get_session_photos(self) -> List[Path]:
         """
         Get all photos captured in the current session.
@@ -214,11 +403,8 @@ class StorageManager:
         Returns:
             Sanitized string safe for filesystem.
         """
-        # Replace problematic characters
-        invalid_chars = '<>:"/\\|?*'
-        sanitized = name
-        for char in invalid_chars:
-            sanitized = sanitized.replace(char, '_')
+        # Replace problematic characters in a single pass
+        sanitized = name.translate(_FILENAME_TRANSLATION)
         
         # Limit length
         if len(sanitized) > 100:
@@ -228,8 +414,4 @@ class StorageManager:
     
     def _is_date_format(self, name: str) -> bool:
         """Check if string matches YYYY-MM-DD format."""
-        try:
-            datetime.strptime(name, "%Y-%m-%d")
-            return True
-        except ValueError:
-            return False
+        return _DATE_DIR_RE.fullmatch(name) is not None
@@ -0,0 +1,55 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import pytest
+import numpy as np
+
+
+def _render_qr(qrcode, data: str, box_size: int) -> np.ndarray:
+    """
+    Render a QR code straight from its module matrix.
+    
+    Args:
+        qrcode: The imported qrcode module.
+        data: Text to encode.
+        box_size: Pixels per QR module.
+        
+    Returns:
+        BGR image of the code with a 4-module quiet zone.
+    """
+    qr = qrcode.QRCode(version=1, box_size=box_size, border=4)
+    qr.add_data(data)
+    qr.make(fit=True)
+    
+    # True modules are black; scale each to a box_size square
+    modules = np.array(qr.get_matrix(), dtype=bool)
+    tile = np.where(modules, 0, 255).astype(np.uint8)
+    tile = tile.repeat(box_size, axis=0).repeat(box_size, axis=1)
+    return np.stack([tile] * 3, axis=-1)
+
+
+@pytest.fixture(scope="session")
+def render_qr():
+    """Provide the QR renderer, skipping if qrcode is not installed."""
+    qrcode = pytest.importorskip("qrcode")
+    return lambda data, box_size=10: _render_qr(qrcode, data, box_size)
+
+
+@pytest.fixture(scope="session")
+def sample_qr_frame(render_qr):
+    """Generate a read-only frame with a QR code, rendered once per session."""
+    qr_array = render_qr("STRUCTURE_TEST_001", box_size=10)
+    
+    # Place QR in center of larger frame
+    frame = np.ones((480, 640, 3), dtype=np.uint8) * 255
+    qr_h, qr_w = qr_array.shape[:2]
+    
+    y_offset = (480 - qr_h) // 2
+    x_offset = (640 - qr_w) // 2
+    
+    frame[y_offset:y_offset+qr_h, x_offset:x_offset+qr_w] = qr_array
+    
+    # Shared by every test; copy before modifying
+    frame.setflags(write=False)
+    return frame
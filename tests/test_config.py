@@ -0,0 +1,153 @@
+"""
+Tests for configuration management.
+"""
+
+import os
+import pytest
+import tempfile
+from pathlib import Path
+
+import yaml
+
+from src.config import ConfigManager, load_config, _parse_yaml_cached
+
+
+MISSION_YAML = """
+flight:
+  takeoff_height_cm: 120
+  movement_speed: 40
+photo:
+  angles:
+    - name: "front"
+      rotation: 0
+    - name: "left90"
+      rotation: -90
+"""
+
+WAYPOINTS_YAML = """
+waypoints:
+  - name: "A"
+    x: 0
+    y: 0
+    z: 100
+  - name: "B"
+    x: 300
+return_home: false
+"""
+
+
+class TestConfigManager:
+    """Tests for ConfigManager class."""
+
+    @pytest.fixture
+    def config_dir(self):
+        """Create temporary directory with config files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            (base / "mission.yaml").write_text(MISSION_YAML)
+            (base / "waypoints.yaml").write_text(WAYPOINTS_YAML)
+            yield base
+
+    def test_load_default_config(self):
+        """Test loading the bundled default configuration."""
+        config = load_config()
+
+        assert config.mission.flight.takeoff_height_cm == 100
+        assert len(config.mission.photo.angles) == 3
+        assert len(config.waypoints) == 3
+
+    def test_load_mission(self, config_dir):
+        """Test loading a mission config."""
+        config = ConfigManager(str(config_dir))
+        mission = config.load_mission("mission.yaml")
+
+        assert mission.flight.takeoff_height_cm == 120
+        assert mission.flight.hover_stability_delay_sec == 2.0
+        assert [a.name for a in mission.photo.angles] == ["front", "left90"]
+
+    def test_unknown_photo_key_rejected(self, config_dir):
+        """Test that a misspelled photo setting is an error, not ignored."""
+        (config_dir / "typo.yaml").write_text("photo:\n  delay_between_shot_sec: 2\n")
+
+        with pytest.raises(TypeError):
+            ConfigManager(str(config_dir)).load_mission("typo.yaml")
+
+    def test_load_waypoints_defaults(self, config_dir):
+        """Test that missing waypoint fields get defaults."""
+        config = ConfigManager(str(config_dir))
+        waypoints = config.load_waypoints("waypoints.yaml")
+
+        assert len(waypoints) == 2
+        assert waypoints[1].name == "B"
+        assert waypoints[1].x == 300
+        assert waypoints[1].z == 100
+        assert not config.return_home
+
+    def test_sidecar_cache_written_and_reused(self, config_dir, monkeypatch):
+        """Test that parsed YAML is cached and reused on the next load."""
+        ConfigManager(str(config_dir)).load_mission("mission.yaml")
+
+        cache_path = config_dir / "mission.yaml.jsoncache"
+        assert cache_path.exists()
+
+        # Bypass the in-process cache and fail if the YAML is parsed again
+        _parse_yaml_cached.cache_clear()
+        monkeypatch.setattr(
+            yaml, "load", lambda *args, **kwargs: pytest.fail("YAML re-parsed")
+        )
+
+        config = ConfigManager(str(config_dir))
+        mission = config.load_mission("mission.yaml")
+        assert mission.flight.takeoff_height_cm == 120
+
+    def test_parsed_yaml_read_only(self, config_dir):
+        """Test that the shared parse result cannot be modified."""
+        config = ConfigManager(str(config_dir))
+        config.load_mission("mission.yaml")
+        raw = config._raw_mission
+
+        with pytest.raises(TypeError):
+            raw["flight"]["movement_speed"] = 10
+        assert isinstance(raw["photo"]["angles"], tuple)
+
+    def test_sidecar_cache_invalidated_on_change(self, config_dir):
+        """Test that a modified YAML file is re-parsed."""
+        ConfigManager(str(config_dir)).load_mission("mission.yaml")
+
+        yaml_path = config_dir / "mission.yaml"
+        cache_path = config_dir / "mission.yaml.jsoncache"
+        yaml_path.write_text("flight:\n  takeoff_height_cm: 80\n")
+
+        # Make sure the YAML is strictly newer than the cache
+        cache_mtime = cache_path.stat().st_mtime
+        os.utime(yaml_path, (cache_mtime + 10, cache_mtime + 10))
+
+        mission = ConfigManager(str(config_dir)).load_mission("mission.yaml")
+        assert mission.flight.takeoff_height_cm == 80
+
+    def test_sidecar_cache_invalidated_by_older_file(self, config_dir):
+        """Test that a replacement YAML with an older mtime is re-parsed."""
+        ConfigManager(str(config_dir)).load_mission("mission.yaml")
+
+        yaml_path = config_dir / "mission.yaml"
+        cache_path = config_dir / "mission.yaml.jsoncache"
+        yaml_path.write_text("flight:\n  takeoff_height_cm: 80\n")
+
+        # Copied in with its original, older timestamp (cp -p)
+        cache_mtime = cache_path.stat().st_mtime
+        os.utime(yaml_path, (cache_mtime - 3600, cache_mtime - 3600))
+
+        mission = ConfigManager(str(config_dir)).load_mission("mission.yaml")
+        assert mission.flight.takeoff_height_cm == 80
+
+    def test_parse_cached_in_process(self, config_dir):
+        """Test that reloading an unchanged file hits the in-process cache."""
+        ConfigManager(str(config_dir)).load_waypoints("waypoints.yaml")
+        hits = _parse_yaml_cached.cache_info().hits
+
+        ConfigManager(str(config_dir)).load_waypoints("waypoints.yaml")
+        assert _parse_yaml_cached.cache_info().hits == hits + 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,376 @@
+"""
+Tests for Flight Navigator module.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+
+from src.modules.flight_navigator import (
+    FlightNavigator,
+    MOTION_SETTLE_TIMEOUT_SEC,
+    NavigationState,
+    TelloCommandError,
+    TelloReceiver,
+    _FastTelloClient,
+    _is_rejection,
+    _plan_moves,
+    _split_distance,
+)
+from src.config import FlightConfig, Waypoint
+
+
+class FakeTello:
+    """Records commands instead of flying."""
+    
+    def __init__(self, support_go: bool = True):
+        self.support_go = support_go
+        self.commands = []
+        self.attempts = []  # every command name sent, failed or not
+        self.state = {}
+        self.failures = {}  # command name -> error replies before success
+        self.timeouts = set()  # command names that never get a reply
+    
+    def __getattr__(self, name):
+        def command(*args):
+            self.attempts.append(name)
+            if name == "go_xyz_speed" and not self.support_go:
+                raise TelloCommandError("error")
+            if name in self.timeouts:
+                raise TimeoutError(name)
+            if self.failures.get(name):
+                self.failures[name] -= 1
+                raise TelloCommandError("error")
+            self.commands.append((name,) + args)
+        return command
+    
+    def get_height(self):
+        return 100
+    
+    def get_current_state(self):
+        return self.state
+
+
+class TestFlightNavigator:
+    """Tests for FlightNavigator class."""
+    
+    @pytest.fixture
+    def flight_config(self):
+        """Create test flight config without stability delays."""
+        return FlightConfig(hover_stability_delay_sec=0.0)
+    
+    def _moves(self, tello):
+        return [c for c in tello.commands if c[0] != "set_speed"]
+    
+    def test_single_diagonal_move(self, flight_config):
+        """Test that a waypoint is reached with one go command."""
+        tello = FakeTello()
+        navigator = FlightNavigator(tello, flight_config)
+        navigator.load_waypoints([Waypoint("A", 300, 100, 50)])
+        
+        result = navigator.navigate_to_next()
+        
+        assert result.success
+        # Tello "go" uses positive y = left
+        assert self._moves(tello) == [("go_xyz_speed", 300, -100, 50, 50)]
+        assert tuple(navigator.get_current_position()) == (300, 100, 50)
+        assert navigator.get_state() == NavigationState.AT_WAYPOINT
+    
+    def test_current_position_read_only(self, flight_config):
+        """Test that the position view cannot be modified by callers."""
+        navigator = FlightNavigator(FakeTello(), flight_config)
+        navigator.load_waypoints([Waypoint("A", 100, 0, 100)])
+        position = navigator.get_current_position()
+        
+        with pytest.raises(ValueError):
+            position[0] = 5
+        
+        navigator.navigate_to_next()
+        # View tracks the live position
+        x, y, z = position
+        assert (x, y, z) == (100, 0, 100)
+    
+    def test_long_move_split_into_segments(self, flight_config):
+        """Test that moves beyond the Tello limit are split evenly."""
+        tello = FakeTello()
+        navigator = FlightNavigator(tello, flight_config)
+        navigator.load_waypoints([Waypoint("A", 1100, 0, 0)])
+        
+        navigator.navigate_to_next()
+        
+        moves = self._moves(tello)
+        assert len(moves) == 3
+        assert sum(m[1] for m in moves) == 1100
+        assert all(abs(m[1]) <= 500 for m in moves)
+    
+    def test_settle_wait_between_chunks_only(self, flight_config):
+        """Test that only commands followed by another one wait to settle."""
+        tello = FakeTello()
+        navigator = FlightNavigator(tello, flight_config)
+        waits = []
+        navigator._await_motion_complete = waits.append
+        navigator.load_waypoints([Waypoint("A", 1100, 0, 0), Waypoint("B", 1200, 0, 0)])
+        
+        navigator.navigate_to_next()
+        assert len(waits) == len(self._moves(tello)) - 1
+        assert all(w <= MOTION_SETTLE_TIMEOUT_SEC for w in waits)
+        
+        waits.clear()
+        navigator.navigate_to_next()
+        assert waits == []
+    
+    def test_settle_wait_reads_telemetry(self, flight_config):
+        """Test that the settle wait ends once the state stream shows no motion."""
+        tello = FakeTello()
+        tello.state = {"vgx": 20, "vgy": 0, "vgz": 0}
+        navigator = FlightNavigator(tello, flight_config)
+        threading.Timer(0.1, tello.state.update, kwargs={"vgx": 0}).start()
+        
+        start = time.monotonic()
+        navigator._await_motion_complete(MOTION_SETTLE_TIMEOUT_SEC)
+        
+        assert 0.05 < time.monotonic() - start < MOTION_SETTLE_TIMEOUT_SEC
+    
+    def test_fallback_to_axis_moves(self, flight_config):
+        """Test fallback when firmware rejects go commands."""
+        tello = FakeTello(support_go=False)
+        navigator = FlightNavigator(tello, flight_config)
+        navigator.load_waypoints([Waypoint("A", 100, -50, 0)])
+        
+        result = navigator.navigate_to_next()
+        
+        assert result.success
+        assert self._moves(tello) == [
+            ("move_forward", 100),
+            ("move_left", 50),
+        ]
+    
+    def test_timeout_keeps_go_enabled(self, flight_config):
+        """Test that a lost go reply fails the leg instead of re-flying it."""
+        tello = FakeTello()
+        tello.timeouts.add("go_xyz_speed")
+        navigator = FlightNavigator(tello, flight_config)
+        navigator.load_waypoints([Waypoint("A", 100, -50, 0)])
+        
+        result = navigator.navigate_to_next()
+        
+        assert not result.success
+        assert self._moves(tello) == []
+        assert navigator._go_supported
+    
+    def test_djitellopy_errors_classified(self):
+        """Test that only error replies in djitellopy messages are rejections."""
+        rejected = Exception(
+            "Command 'go 100 0 0 50' was unsuccessful for 4 tries. "
+            "Latest response:\t'error'"
+        )
+        timed_out = Exception(
+            "Command 'go 100 0 0 50' was unsuccessful for 4 tries. "
+            "Latest response:\t'Aborting command 'go 100 0 0 50'. "
+            "Did not receive a response after 7 seconds'"
+        )
+        
+        assert _is_rejection(rejected)
+        assert not _is_rejection(timed_out)
+    
+    def test_navigate_async_overlaps_other_work(self, flight_config):
+        """Test that async navigation runs alongside other coroutines."""
+        tello = FakeTello()
+        navigator = FlightNavigator(tello, flight_config)
+        navigator.load_waypoints([Waypoint("A", 100, 0, 0)])
+        
+        async def other_work():
+            await asyncio.sleep(0)
+            return "done"
+        
+        async def run():
+            return await asyncio.gather(
+                navigator.navigate_to_next_async(), other_work()
+            )
+        
+        result, other = asyncio.run(run())
+        
+        assert result.success
+        assert other == "done"
+    
+    def test_dropped_command_retried(self, flight_config):
+        """Test that a failed command is retried instead of aborting."""
+        tello = FakeTello()
+        tello.failures["go_xyz_speed"] = 1
+        navigator = FlightNavigator(tello, flight_config)
+        navigator.load_waypoints([Waypoint("A", 100, 0, 0)])
+        
+        result = navigator.navigate_to_next()
+        
+        assert result.success
+        assert self._moves(tello) == [("go_xyz_speed", 100, 0, 0, 50)]
+        assert navigator.get_retry_stats() == {"go_xyz_speed": 1}
+    
+    def test_timed_out_move_not_resent(self, flight_config):
+        """Test that a move without a reply is not sent a second time."""
+        tello = FakeTello()
+        tello.timeouts.add("go_xyz_speed")
+        navigator = FlightNavigator(tello, flight_config)
+        navigator.load_waypoints([Waypoint("A", 100, 0, 0)])
+        
+        result = navigator.navigate_to_next()
+        
+        assert not result.success
+        assert tello.attempts.count("go_xyz_speed") == 1
+        assert navigator.get_retry_stats() == {}
+    
+    def test_drift_compensation(self, flight_config):
+        """Test that residual velocity is extrapolated over the latency."""
+        tello = FakeTello()
+        tello.state = {"vgx": 100, "vgy": 0, "vgz": 0}
+        navigator = FlightNavigator(tello, flight_config)
+        navigator._avg_cmd_latency_sec = 0.2
+        # Keep the latency estimate fixed for the test
+        navigator._update_cmd_latency = lambda sample: None
+        navigator.load_waypoints([Waypoint("A", 300, 0, 0)])
+        
+        navigator.navigate_to_next()
+        
+        # Drone predicted 20cm further forward, so the leg is shorter
+        assert self._moves(tello) == [("go_xyz_speed", 280, 0, 0, 50)]
+    
+    def test_total_path_length(self, flight_config):
+        """Test path length summed over consecutive waypoints."""
+        navigator = FlightNavigator(FakeTello(), flight_config)
+        navigator.load_waypoints([
+            Waypoint("A", 0, 0, 100),
+            Waypoint("B", 300, 400, 100),
+            Waypoint("C", 300, 400, 220),
+        ])
+        
+        assert navigator.total_path_length_cm() == pytest.approx(620.0)
+    
+    def test_optimize_order(self):
+        """Test nearest-neighbor reordering of waypoints."""
+        config = FlightConfig(hover_stability_delay_sec=0.0, optimize_order=True)
+        navigator = FlightNavigator(FakeTello(), config)
+        navigator.load_waypoints([
+            Waypoint("far", 600, 0, 100),
+            Waypoint("near", 100, 0, 100),
+            Waypoint("mid", 300, 0, 100),
+        ])
+        
+        assert navigator._waypoint_names == ["near", "mid", "far"]
+        assert navigator._waypoint_xyz[:, 0].tolist() == [100, 300, 600]
+
+
+class TestPlanMoves:
+    """Tests for the movement planner."""
+    
+    def test_axis_plan_chunks_and_order(self):
+        """Test axis plans go Z first and split long moves."""
+        plan = _plan_moves((0, 0, 100), (1200, 0, 50), 50, False)
+        
+        assert plan == (
+            ("move_down", (50,)),
+            ("move_forward", (500,)),
+            ("move_forward", (500,)),
+            ("move_forward", (200,)),
+        )
+    
+    def test_split_distance(self):
+        """Test chunking drops only a sub-minimum tail."""
+        assert _split_distance(1020).tolist() == [500, 500, 20]
+        assert _split_distance(1010).tolist() == [500, 500]
+        assert _split_distance(0).tolist() == []
+    
+    def test_small_moves_skipped(self):
+        """Test that moves below the Tello minimum are dropped."""
+        assert _plan_moves((0, 0, 0), (10, -5, 15), 50, True) == ()
+    
+    def test_plan_is_cached(self):
+        """Test that repeated legs hit the planner cache."""
+        _plan_moves((0, 0, 0), (700, 30, 0), 50, True)
+        hits = _plan_moves.cache_info().hits
+        
+        _plan_moves((0, 0, 0), (700, 30, 0), 50, True)
+        assert _plan_moves.cache_info().hits == hits + 1
+
+
+class TestFastTelloClient:
+    """Tests for the lightweight UDP command client."""
+    
+    @pytest.fixture
+    def fake_drone(self):
+        """Start UDP endpoints that answer commands from a reply list."""
+        sockets = []
+        
+        def start(*replies, host="127.0.0.1"):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.bind((host, 0))
+            sockets.append(sock)
+            received = []
+            
+            def serve():
+                for reply in replies:
+                    data, addr = sock.recvfrom(64)
+                    received.append(data)
+                    sock.sendto(reply, addr)
+            
+            threading.Thread(target=serve, daemon=True).start()
+            return sock.getsockname()[1], received
+        
+        yield start
+        for sock in sockets:
+            sock.close()
+    
+    def test_commands_encoded_and_acked(self, fake_drone):
+        """Test that commands are sent as SDK strings and ACKs accepted."""
+        port, received = fake_drone(b"ok", b"ok")
+        client = _FastTelloClient("127.0.0.1", port=port, timeout=2.0)
+        
+        client.go_xyz_speed(100, -20, 0, 50)
+        client.rotate_counter_clockwise(45)
+        client.close()
+        
+        assert received == [b"go 100 -20 0 50", b"ccw 45"]
+    
+    def test_error_response_raises(self, fake_drone):
+        """Test that a non-ok response raises."""
+        port, _ = fake_drone(b"error")
+        client = _FastTelloClient("127.0.0.1", port=port, timeout=2.0)
+        
+        with pytest.raises(RuntimeError):
+            client.move_up(50)
+        client.close()
+    
+    def test_clients_share_drone_link(self, fake_drone):
+        """Test that closing one client leaves another on the drone working."""
+        port, received = fake_drone(b"ok", b"ok")
+        first = _FastTelloClient("127.0.0.1", port=port, timeout=2.0)
+        second = _FastTelloClient("127.0.0.1", port=port, timeout=2.0)
+        
+        first.move_up(50)
+        first.close()
+        first.close()  # repeated close must not drop the other client
+        second.move_down(50)
+        second.close()
+        
+        assert received == [b"up 50", b"down 50"]
+    
+    def test_acks_routed_per_drone(self, fake_drone):
+        """Test that two drones share one receiver without mixing ACKs."""
+        port_a, _ = fake_drone(b"ok", host="127.0.0.1")
+        port_b, _ = fake_drone(b"error", host="127.0.0.2")
+        client_a = _FastTelloClient("127.0.0.1", port=port_a, timeout=2.0)
+        client_b = _FastTelloClient("127.0.0.2", port=port_b, timeout=2.0)
+        
+        with pytest.raises(RuntimeError):
+            client_b.move_up(50)
+        client_a.move_up(50)
+        
+        assert TelloReceiver.instance() is client_a._receiver is client_b._receiver
+        client_a.close()
+        client_b.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,54 @@
+"""
+Tests for the command line interface.
+"""
+
+import pytest
+
+from src.main import parse_args
+
+
+class TestParseArgs:
+    """Tests for parse_args."""
+    
+    def test_defaults(self):
+        """Test defaults without arguments."""
+        args = parse_args([])
+        
+        assert not args["live"]
+        assert args["mission_config"] == "config/mission_default.yaml"
+        assert args["test"] is None
+    
+    def test_inline_and_separate_values(self):
+        """Test --opt=value and --opt value forms."""
+        args = parse_args([
+            "--mission-config=m.yaml", "--waypoints-config", "w.yaml", "--live",
+        ])
+        
+        assert args["mission_config"] == "m.yaml"
+        assert args["waypoints_config"] == "w.yaml"
+        assert args["live"]
+    
+    @pytest.mark.parametrize("argv", [
+        ["--mission-config"],
+        ["--mission-config", "--live"],
+        ["--test", "teleport"],
+        ["--unknown"],
+    ], ids=["missing", "option-as-value", "bad-choice", "unrecognized"])
+    def test_usage_errors(self, argv, capsys):
+        """Test that invalid arguments exit with status 2 like argparse."""
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args(argv)
+        
+        assert exc_info.value.code == 2
+        assert "main.py: error:" in capsys.readouterr().err
+    
+    def test_option_as_value_message(self, capsys):
+        """Test that a following option is not taken as the value."""
+        with pytest.raises(SystemExit):
+            parse_args(["--mission-config", "--live"])
+        
+        assert "--mission-config: expected one argument" in capsys.readouterr().err
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,26 +2,35 @@
 Tests for Photo Capture module.
 """
 
+import threading
+import time
+
 import pytest
 import numpy as np
-import tempfile
+import cv2
 from pathlib import Path
 
 from src.utils.storage import StorageManager
+from src.utils.frame_buffer import LatestFrame
 from src.modules.photo_capture import PhotoCapture, PhotoCaptureSimulator
 from src.config import PhotoConfig, PhotoAngle
 
+# Blank camera frame for tests that don't inspect pixels; read-only
+# because it is shared
+_DUMMY_FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+_DUMMY_FRAME.setflags(write=False)
+
+
+@pytest.fixture(scope="module")
+def temp_storage(tmp_path_factory):
+    """Create temporary storage manager shared by the module's tests."""
+    # Tests keep their photos apart by structure ID
+    return StorageManager(str(tmp_path_factory.mktemp("storage")))
+
 
 class TestPhotoCapture:
     """Tests for PhotoCapture class."""
     
-    @pytest.fixture
-    def temp_storage(self):
-        """Create temporary storage manager."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = StorageManager(tmpdir)
-            yield storage
-    
     @pytest.fixture
     def photo_config(self):
         """Create test photo config."""
@@ -44,8 +53,7 @@ class TestPhotoCapture:
         """Test capturing a single frame."""
         capture = PhotoCapture(temp_storage, photo_config)
         
-        # Create test frame
-        frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+        frame = _DUMMY_FRAME
         
         result = capture.capture_single_frame(
             frame_source=lambda: frame,
@@ -57,6 +65,136 @@ class TestPhotoCapture:
         assert result.success
         assert Path(result.file_path).exists()
     
+    def test_capture_all_angles(self, temp_storage, photo_config):
+        """Test multi-angle capture rotates, saves and returns home."""
+        capture = PhotoCapture(temp_storage, photo_config)
+        rotations = []
+        capture.set_rotation_function(rotations.append)
+        
+        frame = _DUMMY_FRAME
+        
+        results = capture.capture_all_angles(
+            frame_source=lambda: frame,
+            structure_id="MULTI_TEST",
+            stop_number=1,
+        )
+        
+        assert [r.angle_name for r in results] == ["front", "left45", "right45"]
+        assert all(r.success for r in results)
+        assert all(Path(r.file_path).exists() for r in results)
+        # Net rotation returns to the original heading
+        assert sum(rotations) == 0
+    
+    def test_capture_written_in_one_batch(
+        self, temp_storage, photo_config, monkeypatch
+    ):
+        """Test that all angles of a stop are written in a single batch."""
+        capture = PhotoCapture(temp_storage, photo_config)
+        batches = []
+        save_batch = temp_storage.save_photos_batch
+        
+        def recording_batch(photos):
+            batches.append([p[3] for p in photos])
+            return save_batch(photos)
+        
+        monkeypatch.setattr(temp_storage, "save_photos_batch", recording_batch)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        
+        results = capture.capture_all_angles(lambda: frame, "BATCH_TEST", 1)
+        
+        assert len(batches) == 1
+        assert sorted(batches[0]) == ["front", "left45", "right45"]
+        assert all(Path(r.file_path).read_bytes()[:2] == b"\xff\xd8" for r in results)
+    
+    def test_heading_restored_when_save_fails(
+        self, temp_storage, photo_config, monkeypatch
+    ):
+        """Test that a storage error fails the photos but not the return turn."""
+        capture = PhotoCapture(temp_storage, photo_config)
+        rotations = []
+        capture.set_rotation_function(rotations.append)
+        
+        def unwritable(*args):
+            raise PermissionError("read-only card")
+        
+        monkeypatch.setattr(temp_storage, "get_photo_path", unwritable)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        
+        results = capture.capture_all_angles(lambda: frame, "RO_TEST", 1)
+        
+        assert not any(r.success for r in results)
+        assert sum(rotations) == 0
+    
+    def test_rotation_sweep_order(self, temp_storage):
+        """Test the larger side is swept first so the return turn is short."""
+        config = PhotoConfig(
+            angles=[
+                PhotoAngle("front", 0),
+                PhotoAngle("left30", -30),
+                PhotoAngle("right90", 90),
+            ],
+            delay_between_shots_sec=0.0,
+        )
+        capture = PhotoCapture(temp_storage, config)
+        calls = []
+        capture.set_rotation_function(
+            lambda d: calls.append(("cw", d)),
+            lambda d: calls.append(("ccw", d)),
+        )
+        
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        results = capture.capture_all_angles(
+            frame_source=lambda: frame,
+            structure_id="SWEEP_TEST",
+            stop_number=1,
+        )
+        
+        assert calls == [("cw", 90), ("ccw", 120), ("cw", 30)]
+        # Results stay in configured order
+        assert [r.angle_name for r in results] == ["front", "left30", "right90"]
+    
+    def test_frame_buffers_reused(self, temp_storage, photo_config):
+        """Test that frame buffers are reused between stops."""
+        capture = PhotoCapture(temp_storage, photo_config)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        
+        capture.capture_all_angles(lambda: frame, "REUSE_TEST", 1)
+        buffers = list(capture._frame_bufs)
+        capture.capture_all_angles(lambda: frame, "REUSE_TEST", 2)
+        
+        assert all(a is b for a, b in zip(buffers, capture._frame_bufs))
+    
+    def test_waits_for_frames_after_settling(
+        self, temp_storage, photo_config, monkeypatch
+    ):
+        """Test that the saved frame was published after the capture began."""
+        capture = PhotoCapture(temp_storage, photo_config)
+        frames = LatestFrame()
+        capture.set_frame_buffer(frames)
+        frames.put(np.full((48, 64, 3), 0, dtype=np.uint8))  # mid-rotation
+        
+        def publish():
+            for value in (1, 2):
+                time.sleep(0.05)
+                frames.put(np.full((48, 64, 3), value, dtype=np.uint8))
+        
+        saved = []
+        monkeypatch.setattr(
+            temp_storage, "save_frame",
+            lambda frame, **kwargs: saved.append(frame[0, 0, 0]) or "saved.jpg",
+        )
+        threading.Thread(target=publish).start()
+        
+        result = capture.capture_single_frame(
+            frame_source=frames.get,
+            structure_id="TEST_STRUCT",
+            stop_number=1,
+            angle_name="test",
+        )
+        
+        assert result.success
+        assert saved == [2]
+    
     def test_capture_with_none_frame(self, temp_storage, photo_config):
         """Test capturing when frame source returns None."""
         capture = PhotoCapture(temp_storage, photo_config)
@@ -75,13 +213,6 @@ class TestPhotoCapture:
 class TestPhotoCaptureSimulator:
     """Tests for PhotoCaptureSimulator class."""
     
-    @pytest.fixture
-    def temp_storage(self):
-        """Create temporary storage manager."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = StorageManager(tmpdir)
-            yield storage
-    
     def test_simulated_capture(self, temp_storage):
         """Test simulated multi-angle capture."""
         simulator = PhotoCaptureSimulator(temp_storage)
@@ -101,8 +232,6 @@ class TestPhotoCaptureSimulator:
     
     def test_placeholder_image_content(self, temp_storage):
         """Test that placeholder images have correct content."""
-        import cv2
-        
         simulator = PhotoCaptureSimulator(temp_storage)
         
         results = simulator.capture_all_angles(
@@ -2,99 +2,131 @@
 Tests for QR Detector module.
 """
 
+import time
+
 import pytest
 import numpy as np
 import cv2
 
+from src.modules.qr_detector import QRDetector, FULL_RES_AFTER_MISSES
+
+# Blank camera frame for tests that don't inspect pixels; read-only
+# because it is shared
+_DUMMY_FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+_DUMMY_FRAME.setflags(write=False)
+
+
+@pytest.fixture(scope="module")
+def _shared_detector():
+    """Create one QRDetector for the module's stateless tests."""
+    return QRDetector()
+
+
+@pytest.fixture
+def detector(_shared_detector):
+    """Provide the shared QRDetector with its miss counter reset."""
+    # Misses from earlier tests would switch later ones to full resolution
+    _shared_detector._scaled_misses = 0
+    return _shared_detector
+
 
 class TestQRDetector:
     """Tests for QRDetector class."""
     
     def test_import(self):
         """Test that QRDetector can be imported."""
-        from src.modules.qr_detector import QRDetector
         assert QRDetector is not None
     
     def test_initialization(self):
         """Test QRDetector initialization."""
-        from src.modules.qr_detector import QRDetector
-        
         detector = QRDetector(fallback_id="TEST_UNKNOWN")
         assert detector.fallback_id == "TEST_UNKNOWN"
     
-    def test_detect_from_empty_frame(self):
-        """Test detection on frame without QR code."""
-        from src.modules.qr_detector import QRDetector
-        
-        detector = QRDetector()
-        
-        # Create blank frame
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        
+    @pytest.mark.parametrize("frame", [None, _DUMMY_FRAME], ids=["none", "empty"])
+    def test_detect_without_qr(self, detector, frame):
+        """Test detection on a missing frame or one without a QR code."""
         result = detector.detect_from_frame(frame)
         assert result is None
     
-    def test_detect_from_none_frame(self):
-        """Test detection on None frame."""
-        from src.modules.qr_detector import QRDetector
-        
-        detector = QRDetector()
-        result = detector.detect_from_frame(None)
-        assert result is None
-    
-    def test_visualization_output(self):
+    def test_visualization_output(self, detector):
         """Test that visualization returns correct tuple."""
-        from src.modules.qr_detector import QRDetector
-        
-        detector = QRDetector()
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame = _DUMMY_FRAME
         
         data, viz_frame = detector.detect_with_visualization(frame)
         
         assert data is None
         assert viz_frame is not None
         assert viz_frame.shape == frame.shape
+        # No detection, so the frame is passed through without a copy
+        assert viz_frame is frame
+    
+    def test_wait_wakes_on_detection(self):
+        """Test that waiting returns as soon as a QR is detected."""
+        detector = QRDetector()
+        detector.detect_from_frame = lambda frame, gray=None: "WAKE_TEST"
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        
+        start = time.monotonic()
+        detector.start_detection(lambda: frame)
+        result = detector.wait_for_detection(timeout_sec=5.0)
+        detector.stop_detection()
+        
+        assert result == "WAKE_TEST"
+        assert time.monotonic() - start < 1.0
+    
+    def test_unchanged_scene_scanned_once(self):
+        """Test that a static view is not decoded again every frame."""
+        detector = QRDetector(scan_scale=1.0)
+        calls = []
+        detector._decode_first = lambda gray: calls.append(gray) or None
+        frame = np.full((48, 64, 3), 128, dtype=np.uint8)
+        
+        detector.start_detection(lambda: frame)
+        for _ in range(5):
+            detector.notify_new_frame()
+            time.sleep(0.02)
+        detector.stop_detection()
+        
+        assert len(calls) == 1
 
 
 class TestQRDetectorWithSampleQR:
     """Tests using generated QR code samples."""
     
-    @pytest.fixture
-    def sample_qr_frame(self):
-        """Generate a frame with a QR code."""
-        try:
-            import qrcode
-            
-            # Generate QR code
-            qr = qrcode.QRCode(version=1, box_size=10, border=4)
-            qr.add_data("STRUCTURE_TEST_001")
-            qr.make(fit=True)
-            
-            qr_image = qr.make_image(fill_color="black", back_color="white")
-            qr_array = np.array(qr_image.convert("RGB"))
-            
-            # Place QR in center of larger frame
-            frame = np.ones((480, 640, 3), dtype=np.uint8) * 255
-            qr_h, qr_w = qr_array.shape[:2]
-            
-            y_offset = (480 - qr_h) // 2
-            x_offset = (640 - qr_w) // 2
-            
-            frame[y_offset:y_offset+qr_h, x_offset:x_offset+qr_w] = qr_array
-            
-            return frame
-            
-        except ImportError:
-            pytest.skip("qrcode library not installed")
-    
-    def test_detect_qr_code(self, sample_qr_frame):
+    def test_detect_qr_code(self, sample_qr_frame, detector):
         """Test detection of QR code in frame."""
-        from src.modules.qr_detector import QRDetector
-        
-        detector = QRDetector()
         result = detector.detect_from_frame(sample_qr_frame)
         
         assert result == "STRUCTURE_TEST_001"
+    
+    def test_detect_from_grayscale(self, sample_qr_frame, detector):
+        """Test detection reusing a caller-provided grayscale frame."""
+        gray = cv2.cvtColor(sample_qr_frame, cv2.COLOR_BGR2GRAY)
+        
+        assert detector.detect_from_frame(sample_qr_frame, gray=gray) == "STRUCTURE_TEST_001"
+        assert detector.detect_from_frame(gray) == "STRUCTURE_TEST_001"
+    
+    def test_small_qr_falls_back_to_full_resolution(self, render_qr):
+        """Test that a QR too small for the downscaled scan is still found."""
+        qr_array = render_qr("SMALL_QR", box_size=3)
+        frame = np.full((480, 640, 3), 255, dtype=np.uint8)
+        frame[100:100 + qr_array.shape[0], 100:100 + qr_array.shape[1]] = qr_array
+        
+        detector = QRDetector(scan_scale=0.5)
+        results = [
+            detector.detect_from_frame(frame)
+            for _ in range(FULL_RES_AFTER_MISSES + 1)
+        ]
+        
+        assert results[:FULL_RES_AFTER_MISSES - 1] == [None] * (FULL_RES_AFTER_MISSES - 1)
+        assert results[-2:] == ["SMALL_QR", "SMALL_QR"]
+    
+    def test_visualization_draws_detection(self, sample_qr_frame, detector):
+        """Test that visualization reports and outlines the QR code."""
+        data, viz_frame = detector.detect_with_visualization(sample_qr_frame)
+        
+        assert data == "STRUCTURE_TEST_001"
+        assert not np.array_equal(viz_frame, sample_qr_frame)
 
 
 if __name__ == "__main__":
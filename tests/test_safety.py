@@ -2,8 +2,25 @@
 Tests for Safety module.
 """
 
+import time
+from types import SimpleNamespace
+
 import pytest
 import numpy as np
+import cv2
+
+from src.modules.safety import (
+    SafetyModule,
+    SafetyConfig,
+    SafetyStatus,
+    POSE_IDLE_INTERVAL_SEC,
+)
+from src.utils.frame_buffer import LatestFrame
+
+# Blank camera frame for tests that don't inspect pixels; read-only
+# because it is shared
+_DUMMY_FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+_DUMMY_FRAME.setflags(write=False)
 
 
 class TestSafetyModule:
@@ -11,45 +28,27 @@ class TestSafetyModule:
     
     def test_import(self):
         """Test that SafetyModule can be imported."""
-        from src.modules.safety import SafetyModule
         assert SafetyModule is not None
     
     def test_initialization(self):
         """Test SafetyModule initialization."""
-        from src.modules.safety import SafetyModule
-        
         safety = SafetyModule()
         assert not safety.is_emergency_triggered()
         assert not safety.is_obstacle_ahead()
     
-    def test_check_empty_frame(self):
-        """Test safety check on empty frame."""
-        from src.modules.safety import SafetyModule
-        
+    @pytest.mark.parametrize("frame", [None, _DUMMY_FRAME], ids=["none", "empty"])
+    def test_check_blank_frame(self, frame):
+        """Test safety check on a missing or empty frame."""
         safety = SafetyModule()
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        
         status = safety.check_frame(frame)
         
         assert not status.obstacle_detected
         assert not status.emergency_gesture_detected
     
-    def test_check_none_frame(self):
-        """Test safety check on None frame."""
-        from src.modules.safety import SafetyModule
-        
-        safety = SafetyModule()
-        status = safety.check_frame(None)
-        
-        assert not status.obstacle_detected
-        assert not status.emergency_gesture_detected
-    
     def test_visualization_output(self):
         """Test visualization returns correct format."""
-        from src.modules.safety import SafetyModule
-        
         safety = SafetyModule()
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame = _DUMMY_FRAME
         
         status, viz_frame = safety.check_frame_with_visualization(frame)
         
@@ -58,8 +57,6 @@ class TestSafetyModule:
     
     def test_emergency_callback_set(self):
         """Test setting emergency callback."""
-        from src.modules.safety import SafetyModule
-        
         callback_called = []
         
         def my_callback():
@@ -73,6 +70,52 @@ class TestSafetyModule:
         
         assert len(callback_called) == 1
         assert safety.is_emergency_triggered()
+    
+    def test_monitoring_skips_unchanged_frame(self):
+        """Test that the same frame object is only checked once."""
+        safety = SafetyModule()
+        calls = []
+        safety.check_frame = lambda frame, **kwargs: calls.append(frame) or SafetyStatus()
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        
+        safety.start_monitoring(lambda: frame)
+        for _ in range(5):
+            safety.notify_new_frame()
+            time.sleep(0.02)
+        safety.stop_monitoring()
+        
+        assert len(calls) == 1
+    
+    def test_monitoring_paced_to_check_interval(self):
+        """Test that a fast stream is checked at most once per interval."""
+        safety = SafetyModule(SafetyConfig(gesture_check_interval_sec=0.1))
+        calls = []
+        safety.check_frame = lambda frame, **kwargs: calls.append(frame) or SafetyStatus()
+        frames = LatestFrame()
+        frames.add_listener(safety.notify_new_frame)
+        
+        safety.start_monitoring(frames.get)
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            frames.put(np.zeros((48, 64, 3), dtype=np.uint8))
+            time.sleep(0.005)
+        safety.stop_monitoring()
+        
+        assert 3 <= len(calls) <= 6
+    
+    def test_pose_gated_on_motion(self):
+        """Test that pose only runs on motion or after the idle interval."""
+        safety = SafetyModule()
+        still = np.zeros((240, 320, 3), dtype=np.uint8)
+        moved = still.copy()
+        moved[20:120, 100:200] = 255
+        
+        assert safety._pose_due(still)
+        assert not safety._pose_due(still.copy())
+        assert safety._pose_due(moved)
+        
+        safety._last_pose_time -= POSE_IDLE_INTERVAL_SEC
+        assert safety._pose_due(moved.copy())
 
 
 class TestObstacleDetection:
@@ -80,8 +123,6 @@ class TestObstacleDetection:
     
     def test_high_edge_density_detection(self):
         """Test that high edge density triggers obstacle detection."""
-        from src.modules.safety import SafetyModule, SafetyConfig
-        
         config = SafetyConfig(obstacle_threshold=0.1)  # Lower threshold
         safety = SafetyModule(config)
         
@@ -90,15 +131,74 @@ class TestObstacleDetection:
         
         # Add grid pattern in center (high edge density)
         center = frame[150:330, 200:440]
-        for i in range(0, center.shape[0], 10):
-            center[i:i+2, :] = 255
-        for j in range(0, center.shape[1], 10):
-            center[:, j:j+2] = 255
+        center[np.arange(center.shape[0]) % 10 < 2, :] = 255
+        center[:, np.arange(center.shape[1]) % 10 < 2] = 255
         
         status = safety.check_frame(frame)
         
         # Should detect obstacle due to high edge density
         assert status.obstacle_detected
+        
+        # Same result when the caller supplies the grayscale frame
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        assert safety.check_frame(frame, gray=gray).obstacle_detected
+
+
+class TestGestureDetection:
+    """Tests for the crossed-arms gesture logic."""
+    
+    @staticmethod
+    def _safety_with_landmarks(points):
+        """Build a SafetyModule whose pose model returns fixed landmarks."""
+        landmarks = [
+            SimpleNamespace(x=x, y=y, visibility=v) for x, y, v in points
+        ]
+        result = SimpleNamespace(
+            pose_landmarks=SimpleNamespace(landmark=landmarks)
+        )
+        
+        safety = SafetyModule()
+        safety._pose = SimpleNamespace(process=lambda rgb: result, close=lambda: None)
+        safety._landmark_ids = tuple(range(6))
+        return safety
+    
+    def test_crossed_arms_detected(self):
+        """Test full confidence for wrists crossed at chest, elbows up."""
+        safety = self._safety_with_landmarks([
+            (0.6, 0.5, 1.0), (0.4, 0.5, 1.0),    # wrists
+            (0.4, 0.3, 1.0), (0.6, 0.3, 1.0),    # shoulders
+            (0.45, 0.4, 1.0), (0.55, 0.4, 1.0),  # elbows
+        ])
+        frame = np.zeros((240, 320, 3), dtype=np.uint8)
+        
+        detected, confidence = safety._detect_crossed_arms(frame)
+        
+        assert detected
+        assert confidence == pytest.approx(1.0)
+    
+    def test_low_visibility_rejected(self):
+        """Test that a hidden wrist disables the gesture."""
+        safety = self._safety_with_landmarks([
+            (0.6, 0.5, 0.2), (0.4, 0.5, 1.0),
+            (0.4, 0.3, 1.0), (0.6, 0.3, 1.0),
+            (0.45, 0.4, 1.0), (0.55, 0.4, 1.0),
+        ])
+        frame = np.zeros((240, 320, 3), dtype=np.uint8)
+        
+        assert safety._detect_crossed_arms(frame) == (False, 0.0)
+    
+    def test_pose_input_buffers_reused(self):
+        """Test that pose input is written into the preallocated buffers."""
+        safety = self._safety_with_landmarks([(0.5, 0.5, 0.0)] * 6)
+        inputs = []
+        process = safety._pose.process
+        safety._pose.process = lambda rgb: inputs.append(rgb) or process(rgb)
+        frame = _DUMMY_FRAME
+        
+        safety._detect_crossed_arms(frame)
+        safety._detect_crossed_arms(frame)
+        
+        assert inputs[0] is inputs[1] is safety._pose_rgb
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+"""
+Tests for Mission State Machine.
+"""
+
+import pytest
+
+from src.config import ConfigManager
+from src.state_machine import MissionStateMachine, MissionState
+
+
+class TestStateTransitions:
+    """Tests for transition handling."""
+    
+    @pytest.fixture
+    def machine(self):
+        """Create a running machine parked in NAVIGATING."""
+        machine = MissionStateMachine(ConfigManager(), simulate=True)
+        machine._running = True
+        machine._state = MissionState.NAVIGATING
+        return machine
+    
+    @staticmethod
+    def _set_handler(monkeypatch, state, handler):
+        """Replace one entry of the shared handler table for a test."""
+        handlers = list(MissionStateMachine._HANDLERS)
+        handlers[state] = handler
+        monkeypatch.setattr(MissionStateMachine, "_HANDLERS", tuple(handlers))
+    
+    def test_emergency_during_handler_wins(self, machine, monkeypatch):
+        """Test that an emergency raised mid-handler is not overwritten."""
+        def navigating(machine):
+            # Safety thread fires while the handler is still running
+            machine.trigger_emergency()
+            return MissionState.STOPPING
+        
+        self._set_handler(monkeypatch, MissionState.NAVIGATING, navigating)
+        
+        assert machine.step() == MissionState.EMERGENCY
+    
+    def test_emergency_between_steps_applied_first(self, machine, monkeypatch):
+        """Test that a queued emergency preempts the current handler."""
+        calls = []
+        self._set_handler(
+            monkeypatch, MissionState.NAVIGATING,
+            lambda machine: calls.append(1) or MissionState.STOPPING,
+        )
+        
+        machine.trigger_emergency()
+        
+        assert machine.step() == MissionState.EMERGENCY
+        assert calls == []
+    
+    def test_handler_result_applied(self, machine, monkeypatch):
+        """Test normal transitions without queued requests."""
+        self._set_handler(
+            monkeypatch, MissionState.NAVIGATING,
+            lambda machine: MissionState.STOPPING,
+        )
+        
+        assert machine.step() == MissionState.STOPPING
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])